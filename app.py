@@ -1,71 +1,245 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+import orjson
 import os
 import re
 import logging
+import logging.handlers
+import queue
+import atexit
+import httpx
 import urllib.parse
 import time
+import math
+import operator
+import threading
+import hashlib
+import functools
+from collections import OrderedDict
 from pathlib import Path
 from dotenv import load_dotenv
 from openai import OpenAI
-from typing import Optional, Dict, List
+from whitenoise import WhiteNoise
+from typing import Optional, Dict, List, Tuple, Literal
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 import json
 import random
 
+try:
+    import redis
+except ImportError:
+    redis = None
+
 # Load environment variables from .env file
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging: request threads only enqueue records, a background listener writes them to stderr
+_log_queue = queue.SimpleQueue()
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
+LOG_ERROR_MAX_CHARS = 512  # upstream error bodies can be huge; keep log lines bounded
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for jsonify() and request.json"""
+
+    def dumps(self, obj, **kwargs) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+class StaticAssetsWhiteNoise(WhiteNoise):
+    """WhiteNoise restricted to front-end asset types, so source files and .env in the project root are never served"""
+
+    STATIC_EXTENSIONS = frozenset({'.html', '.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.ico'})
+
+    def add_file_to_dictionary(self, url, path, stat_cache=None):
+        if os.path.splitext(path)[1].lower() in self.STATIC_EXTENSIONS:
+            super().add_file_to_dictionary(url, path, stat_cache=stat_cache)
+
+class ChatMessage(BaseModel):
+    """One prior turn of the conversation as sent by the front end"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    role: Literal['user', 'assistant']
+    content: str = Field(default='', max_length=32000)
+
+class ChatRequest(BaseModel):
+    """Body of POST /api/chat, validated and parsed in a single pass"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    message: str = Field(default='', max_length=4000)
+    history: List[ChatMessage] = Field(default_factory=list, max_length=50)
 
 BASE_DIR = Path(__file__).resolve().parent
 app = Flask(__name__, static_folder=str(BASE_DIR), template_folder=str(BASE_DIR))
+app.json = OrjsonProvider(app)
+# Static assets are answered by WhiteNoise before Flask routing; assets aren't fingerprinted, so keep max_age short
+app.wsgi_app = StaticAssetsWhiteNoise(app.wsgi_app, root=str(BASE_DIR), max_age=3600)
 CORS(app)  # Enable CORS for all routes
 
 # Initialize APIs
 openai_api_key = os.getenv("OPENAI_API_KEY")
 
+# Shared HTTP/2 connection pool so concurrent chats multiplex over reused TLS sessions to the OpenAI API
+openai_http_client = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0),
+    # Fail a hung call well inside gunicorn's 120s worker timeout so the circuit breaker sees it
+    timeout=httpx.Timeout(30.0, connect=3.05)
+)
+
 # Initialize OpenAI client
 openai_client = None
 if openai_api_key and openai_api_key != "your-openai-api-key-here":
     try:
-        openai_client = OpenAI(api_key=openai_api_key)
+        # No SDK retries: each failed call counts toward the circuit breaker, which trips in seconds instead of minutes
+        openai_client = OpenAI(api_key=openai_api_key, http_client=openai_http_client, max_retries=0)
     except Exception as e:
         logger.warning(f"Failed to initialize OpenAI client: {str(e)}")
 else:
     logger.warning("OPENAI_API_KEY not set. AI functionality will be limited.")
 
+OPENAI_CHAT_MODEL = "gpt-4o"
+# Fixed generation settings for every chat completion, built once instead of per call
+OPENAI_CHAT_PARAMS = {"model": OPENAI_CHAT_MODEL, "max_tokens": 8000, "temperature": 0.7, "top_p": 0.9}
+PROMPT_VERSION = "1"  # Bump whenever the system prompt changes to invalidate cached responses
+CHAT_HISTORY_TURNS = 6  # Most recent history messages sent to the model
+
+# Exact-match response cache, shared through Redis when REDIS_URL is set
+RESPONSE_CACHE_TTL = 3600  # seconds
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+_response_cache = OrderedDict()  # key -> (response, stored_at)
+_response_cache_lock = threading.Lock()
+
+# Identical prompts already in flight share one upstream call (cache key -> completion event)
+INFLIGHT_WAIT_TIMEOUT = 90  # seconds
+_inflight_requests = {}
+_inflight_lock = threading.Lock()
+
+# Circuit breaker: after repeated upstream failures, fail fast instead of queueing on a sick API
+CIRCUIT_BREAKER_FAIL_MAX = 5
+CIRCUIT_BREAKER_RESET_TIMEOUT = 30  # seconds before a trial call is let through
+CIRCUIT_OPEN_MESSAGE = "I'm getting a lot of requests right now and need a short breather. Please try again in about 30 seconds!"
+_breaker_failures = 0
+_breaker_opened_at = 0.0
+_breaker_lock = threading.Lock()
+
+redis_client = None
+redis_url = os.getenv("REDIS_URL")
+if redis_url and redis:
+    try:
+        redis_client = redis.Redis(connection_pool=redis.BlockingConnectionPool.from_url(redis_url, max_connections=32))
+    except Exception as e:
+        logger.warning(f"Failed to initialize Redis client: {str(e)}")
+elif redis_url:
+    logger.warning("REDIS_URL is set but the redis package is not installed. Using in-process response cache.")
+
+# Semantic response cache (opt-in): reuse answers for paraphrased questions
+SEMANTIC_CACHE_ENABLED = os.getenv('SEMANTIC_CACHE', 'False').lower() == 'true'
+SEMANTIC_CACHE_MODEL = "text-embedding-3-small"
+SEMANTIC_CACHE_DIMENSIONS = 256
+SEMANTIC_CACHE_THRESHOLD = 0.92
+SEMANTIC_CACHE_TTL = 3600  # seconds
+SEMANTIC_CACHE_MAX_ENTRIES = 512
+SEMANTIC_CACHE_HISTORY_TURNS = 2
+_semantic_cache = []  # (unit vector, places fingerprint, response, stored_at)
+_semantic_cache_lock = threading.Lock()
+
+# Bare greetings and sign-offs get a canned reply without a model call
+GREETING_RE = re.compile(r"^\s*(hi|hello|hey|thanks|thank you|bye|goodbye)(?:\s+(?:there|jetfriend))?[.!?\s]*$", re.IGNORECASE)
+_GREETING_REPLY = "Hi there! ✈️ I'm JetFriend, your travel planning buddy. Where are you dreaming of going? Tell me a destination and I'll find great places to eat, stay and explore!"
+_THANKS_REPLY = "You're very welcome! 😊 Let me know if there's anything else I can help you plan for your trip."
+_GOODBYE_REPLY = "Safe travels! 🌍 Come back any time you need help planning your next adventure."
+CANNED_RESPONSES = {
+    'hi': _GREETING_REPLY, 'hello': _GREETING_REPLY, 'hey': _GREETING_REPLY,
+    'thanks': _THANKS_REPLY, 'thank you': _THANKS_REPLY,
+    'bye': _GOODBYE_REPLY, 'goodbye': _GOODBYE_REPLY,
+}
+
+# Generated place data per normalized query, so follow-ups see the same cards (query -> (places, stored_at))
+PLACES_CACHE_TTL = 3600  # seconds
+PLACES_CACHE_MAX_ENTRIES = 256
+_places_cache = OrderedDict()
+_places_cache_lock = threading.Lock()
+
 # Google Places API removed - using alternative location data
 # Using alternative data processing without Google Places dependency
 logger.info("✅ Alternative location processing initialized")
 
+BASIC_KEYWORDS = [
+    # Greetings and general
+    'hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening',
+    'how are you', 'what is', 'what are', 'who is', 'when is', 'why',
+    'explain', 'tell me about', 'what does', 'how does', 'define',
+
+    # Time and weather
+    'what time', 'time zone', 'current time', 'weather', 'temperature',
+    'forecast', 'rain', 'sunny', 'cloudy',
+
+    # Currency and general info
+    'currency', 'exchange rate', 'language', 'translate', 'how to say',
+    'thank you', 'please', 'excuse me', 'culture', 'history',
+
+    # Help and guidance
+    'help', 'assistance', 'support', 'how can', 'what can you do',
+    'features', 'capabilities'
+]
+# One compiled alternation scans the message once instead of a substring test per keyword
+BASIC_KEYWORDS_RE = re.compile("|".join(map(re.escape, sorted(set(BASIC_KEYWORDS), key=len, reverse=True))))
+
 def is_basic_question(message: str) -> bool:
     """
     Detect if this is a basic question that doesn't require location cards
     Returns True for general questions, greetings, time, weather, etc.
     """
-    basic_keywords = [
-        # Greetings and general
-        'hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening',
-        'how are you', 'what is', 'what are', 'who is', 'when is', 'why',
-        'explain', 'tell me about', 'what does', 'how does', 'define',
-
-        # Time and weather
-        'what time', 'time zone', 'current time', 'weather', 'temperature',
-        'forecast', 'rain', 'sunny', 'cloudy',
-
-        # Currency and general info
-        'currency', 'exchange rate', 'language', 'translate', 'how to say',
-        'thank you', 'please', 'excuse me', 'culture', 'history',
-
-        # Help and guidance
-        'help', 'assistance', 'support', 'how can', 'what can you do',
-        'features', 'capabilities'
-    ]
-
-    message_lower = message.lower()
-    return any(keyword in message_lower for keyword in basic_keywords)
+    return BASIC_KEYWORDS_RE.search(message.lower()) is not None
+
+# Strong indicators of singular requests
+SINGULAR_REQUEST_PATTERNS = [
+    r'\ba\s+(?:good|nice|great|best)?\s*(?:restaurant|hotel|cafe|bar|place|spot)',
+    r'\bthe\s+(?:best|top|most popular)\s+(?:restaurant|hotel|cafe|bar|place|spot)',
+    r'\bone\s+(?:good|nice|great|restaurant|hotel|cafe|bar|place|spot)',
+    r'\bfind\s+(?:me\s+)?(?:a|one)\s+(?:restaurant|hotel|cafe|bar|place|spot)',
+    r'\bwhere\s+(?:is|can\s+i\s+find)\s+(?:a|the|one)\s+(?:good|nice|great)?\s*(?:restaurant|hotel|cafe|bar|place|spot)',
+    r'\brecommend\s+(?:me\s+)?(?:a|one)\s+(?:good|nice|great)?\s*(?:restaurant|hotel|cafe|bar|place|spot)',
+    r'\bneed\s+(?:a|one)\s+(?:good|nice|great)?\s*(?:restaurant|hotel|cafe|bar|place|spot)',
+    r'\blooking\s+for\s+(?:a|one)\s+(?:good|nice|great)?\s*(?:restaurant|hotel|cafe|bar|place|spot)'
+]
+
+# Strong indicators of plural/multiple requests
+PLURAL_REQUEST_PATTERNS = [
+    r'\b(?:restaurants|hotels|cafes|bars|places|spots)\b',
+    r'\b(?:some|several|multiple|few)\s+(?:restaurant|hotel|cafe|bar|place|spot)',
+    r'\b(?:list|show|give)\s+me\s+(?:some|several|multiple|a\s+few)',
+    r'\bwhat\s+(?:are\s+some|are\s+the\s+best)\s+(?:restaurant|hotel|cafe|bar|place|spot)',
+    r'\btop\s+\d+\s+(?:restaurant|hotel|cafe|bar|place|spot)',
+    r'\bbest\s+(?:restaurant|hotel|cafe|bar|place|spot)s\b',
+    r'\b(?:things\s+to\s+do|activities|attractions|sights)\b',
+    r'\bmulti[\s-]?day\b',
+    r'\bitinerary\b',
+    r'\bday\s+\d+\b',
+    r'\b\d+\s+day\b',
+    r'\bentire\s+day\b',
+    r'\bfull\s+day\b',
+    r'\bweekend\b',
+    r'\btrip\b'
+]
+# Each pattern list compiled into one alternation, searched once per message
+SINGULAR_REQUEST_RE = re.compile("|".join(f"(?:{pattern})" for pattern in SINGULAR_REQUEST_PATTERNS))
+PLURAL_REQUEST_RE = re.compile("|".join(f"(?:{pattern})" for pattern in PLURAL_REQUEST_PATTERNS))
+
+# Destination mentioned in a query, e.g. "restaurants in Kyoto"
+LOCATION_RE = re.compile(r'(?:in|at|near)\s+([A-Za-z\s]+?)(?:\s|$|[.,!?])', re.IGNORECASE)
 
 def detect_singular_request(message: str) -> bool:
     """
@@ -75,50 +249,78 @@ def detect_singular_request(message: str) -> bool:
     """
     message_lower = message.lower()
 
-    # Strong indicators of singular requests
-    singular_patterns = [
-        r'\ba\s+(?:good|nice|great|best)?\s*(?:restaurant|hotel|cafe|bar|place|spot)',
-        r'\bthe\s+(?:best|top|most popular)\s+(?:restaurant|hotel|cafe|bar|place|spot)',
-        r'\bone\s+(?:good|nice|great|restaurant|hotel|cafe|bar|place|spot)',
-        r'\bfind\s+(?:me\s+)?(?:a|one)\s+(?:restaurant|hotel|cafe|bar|place|spot)',
-        r'\bwhere\s+(?:is|can\s+i\s+find)\s+(?:a|the|one)\s+(?:good|nice|great)?\s*(?:restaurant|hotel|cafe|bar|place|spot)',
-        r'\brecommend\s+(?:me\s+)?(?:a|one)\s+(?:good|nice|great)?\s*(?:restaurant|hotel|cafe|bar|place|spot)',
-        r'\bneed\s+(?:a|one)\s+(?:good|nice|great)?\s*(?:restaurant|hotel|cafe|bar|place|spot)',
-        r'\blooking\s+for\s+(?:a|one)\s+(?:good|nice|great)?\s*(?:restaurant|hotel|cafe|bar|place|spot)'
-    ]
-
-    # Strong indicators of plural/multiple requests
-    plural_patterns = [
-        r'\b(?:restaurants|hotels|cafes|bars|places|spots)\b',
-        r'\b(?:some|several|multiple|few)\s+(?:restaurant|hotel|cafe|bar|place|spot)',
-        r'\b(?:list|show|give)\s+me\s+(?:some|several|multiple|a\s+few)',
-        r'\bwhat\s+(?:are\s+some|are\s+the\s+best)\s+(?:restaurant|hotel|cafe|bar|place|spot)',
-        r'\btop\s+\d+\s+(?:restaurant|hotel|cafe|bar|place|spot)',
-        r'\bbest\s+(?:restaurant|hotel|cafe|bar|place|spot)s\b',
-        r'\b(?:things\s+to\s+do|activities|attractions|sights)\b',
-        r'\bmulti[\s-]?day\b',
-        r'\bitinerary\b',
-        r'\bday\s+\d+\b',
-        r'\b\d+\s+day\b',
-        r'\bentire\s+day\b',
-        r'\bfull\s+day\b',
-        r'\bweekend\b',
-        r'\btrip\b'
-    ]
-
     # Check for plural patterns first (stronger indicators)
-    for pattern in plural_patterns:
-        if re.search(pattern, message_lower):
-            return False
+    if PLURAL_REQUEST_RE.search(message_lower):
+        return False
 
     # Check for singular patterns
-    for pattern in singular_patterns:
-        if re.search(pattern, message_lower):
-            return True
+    if SINGULAR_REQUEST_RE.search(message_lower):
+        return True
 
     # Default to singular for ambiguous cases
     return True
 
+LOCATION_KEYWORDS = [
+    # Accommodations
+    'restaurant', 'hotel', 'hostel', 'resort', 'accommodation', 'lodge', 'inn',
+    'motel', 'villa', 'apartment', 'airbnb', 'where to stay',
+
+    # Attractions & Sights
+    'attraction', 'museum', 'park', 'beach', 'gallery', 'theater', 'cinema',
+    'zoo', 'aquarium', 'castle', 'palace', 'cathedral', 'church', 'temple',
+    'monument', 'landmark', 'viewpoint', 'scenic', 'observation deck',
+
+    # Transportation
+    'airport', 'station', 'train', 'bus', 'metro', 'subway', 'taxi', 'uber',
+    'transport', 'terminal', 'port', 'ferry', 'cruise',
+
+    # Shopping & Entertainment
+    'shopping', 'mall', 'market', 'boutique', 'store', 'outlet',
+    'cafe', 'bar', 'club', 'pub', 'lounge', 'brewery', 'winery',
+    'nightlife', 'entertainment', 'theater', 'concert', 'festival',
+
+    # Services & Facilities
+    'gym', 'spa', 'hospital', 'pharmacy', 'bank', 'atm', 'gas station',
+    'embassy', 'consulate', 'police', 'tourist information',
+
+    # Location Qualifiers
+    'near me', 'nearby', 'around', 'close to', 'in ', 'at ', 'around ',
+    'best places', 'top rated', 'reviews', 'open now', 'hours',
+    'directions', 'how to get', 'distance', 'travel time',
+
+    # Activities & Experiences
+    'food', 'eat', 'drink', 'dine', 'taste', 'try',
+    'stay', 'sleep', 'rest', 'relax',
+    'visit', 'see', 'do', 'explore', 'discover', 'experience',
+    'tour', 'excursion', 'adventure', 'activity', 'things to do',
+    'breakfast', 'lunch', 'dinner', 'brunch', 'coffee', 'dessert',
+    'activities', 'sights', 'landmarks', 'attractions',
+
+    # Travel Planning Keywords
+    'trip', 'travel', 'vacation', 'holiday', 'itinerary', 'plan',
+    'day trip', 'weekend', 'getaway', 'journey', 'tour',
+    '1 day', '2 day', '3 day', '4 day', '5 day', 'week',
+    'day 1', 'day 2', 'day 3', 'first day', 'second day',
+
+    # Local & Authentic
+    'hidden gems', 'local favorites', 'underground', 'authentic',
+    'local', 'traditional', 'typical', 'famous', 'popular',
+    'must see', 'must visit', 'must try', 'bucket list',
+
+    # Booking & Reservations
+    'reservations', 'book', 'booking', 'reserve', 'tickets',
+    'call', 'contact', 'website', 'menu', 'prices', 'cost',
+    'opening hours', 'schedule', 'availability',
+
+    # Additional location triggers
+    'where', 'location', 'place', 'spot', 'venue', 'destination',
+    'address', 'find', 'search', 'recommend', 'suggest', 'show me',
+    'best', 'top', 'good', 'great', 'nice', 'cheap', 'expensive',
+    'close', 'nearby', 'around here', 'walking distance'
+]
+# One compiled alternation scans the message once instead of a substring test per keyword
+LOCATION_KEYWORDS_RE = re.compile("|".join(map(re.escape, sorted(set(LOCATION_KEYWORDS), key=len, reverse=True))))
+
 def detect_location_query(message: str) -> bool:
     """
     Detect if user query requires real-time location data for ANY travel-related content.
@@ -126,67 +328,17 @@ def detect_location_query(message: str) -> bool:
     When True, hero place cards will be shown for enhanced location recommendations.
     This ensures all location queries use the hero card format unless it's a basic question.
     """
-    location_keywords = [
-        # Accommodations
-        'restaurant', 'hotel', 'hostel', 'resort', 'accommodation', 'lodge', 'inn',
-        'motel', 'villa', 'apartment', 'airbnb', 'where to stay',
-
-        # Attractions & Sights
-        'attraction', 'museum', 'park', 'beach', 'gallery', 'theater', 'cinema',
-        'zoo', 'aquarium', 'castle', 'palace', 'cathedral', 'church', 'temple',
-        'monument', 'landmark', 'viewpoint', 'scenic', 'observation deck',
-
-        # Transportation
-        'airport', 'station', 'train', 'bus', 'metro', 'subway', 'taxi', 'uber',
-        'transport', 'terminal', 'port', 'ferry', 'cruise',
-
-        # Shopping & Entertainment
-        'shopping', 'mall', 'market', 'boutique', 'store', 'outlet',
-        'cafe', 'bar', 'club', 'pub', 'lounge', 'brewery', 'winery',
-        'nightlife', 'entertainment', 'theater', 'concert', 'festival',
-
-        # Services & Facilities
-        'gym', 'spa', 'hospital', 'pharmacy', 'bank', 'atm', 'gas station',
-        'embassy', 'consulate', 'police', 'tourist information',
-
-        # Location Qualifiers
-        'near me', 'nearby', 'around', 'close to', 'in ', 'at ', 'around ',
-        'best places', 'top rated', 'reviews', 'open now', 'hours',
-        'directions', 'how to get', 'distance', 'travel time',
-
-        # Activities & Experiences
-        'food', 'eat', 'drink', 'dine', 'taste', 'try',
-        'stay', 'sleep', 'rest', 'relax',
-        'visit', 'see', 'do', 'explore', 'discover', 'experience',
-        'tour', 'excursion', 'adventure', 'activity', 'things to do',
-        'breakfast', 'lunch', 'dinner', 'brunch', 'coffee', 'dessert',
-        'activities', 'sights', 'landmarks', 'attractions',
-
-        # Travel Planning Keywords
-        'trip', 'travel', 'vacation', 'holiday', 'itinerary', 'plan',
-        'day trip', 'weekend', 'getaway', 'journey', 'tour',
-        '1 day', '2 day', '3 day', '4 day', '5 day', 'week',
-        'day 1', 'day 2', 'day 3', 'first day', 'second day',
-
-        # Local & Authentic
-        'hidden gems', 'local favorites', 'underground', 'authentic',
-        'local', 'traditional', 'typical', 'famous', 'popular',
-        'must see', 'must visit', 'must try', 'bucket list',
-
-        # Booking & Reservations
-        'reservations', 'book', 'booking', 'reserve', 'tickets',
-        'call', 'contact', 'website', 'menu', 'prices', 'cost',
-        'opening hours', 'schedule', 'availability',
-
-        # Additional location triggers
-        'where', 'location', 'place', 'spot', 'venue', 'destination',
-        'address', 'find', 'search', 'recommend', 'suggest', 'show me',
-        'best', 'top', 'good', 'great', 'nice', 'cheap', 'expensive',
-        'close', 'nearby', 'around here', 'walking distance'
-    ]
-    
-    message_lower = message.lower()
-    return any(keyword in message_lower for keyword in location_keywords)
+    return LOCATION_KEYWORDS_RE.search(message.lower()) is not None
+
+def analyze_location_query(message: str) -> Tuple[bool, Optional[str]]:
+    """
+    Classify a message and pull out the destination it names in a single call.
+    Returns (is_location_query, location), where location is None when no "in/at/near X" phrase is found.
+    """
+    if not LOCATION_KEYWORDS_RE.search(message.lower()):
+        return False, None
+    location_match = LOCATION_RE.search(message)
+    return True, (location_match.group(1).strip() if location_match else None)
 
 def get_location_specific_places(query: str, location: str = None) -> List[Dict]:
     """
@@ -280,314 +432,316 @@ def get_location_specific_places(query: str, location: str = None) -> List[Dict]
     
     return places[:8]  # Return up to 8 places
 
+# High-quality stock images for different place types
+IMAGE_LIBRARY = {
+    # Food & Restaurants - Expanded
+    'pizza': [
+        'https://images.pexels.com/photos/315755/pexels-photo-315755.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1653877/pexels-photo-1653877.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1640777/pexels-photo-1640777.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/905847/pexels-photo-905847.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/708587/pexels-photo-708587.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/845808/pexels-photo-845808.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'burger': [
+        'https://images.pexels.com/photos/1639557/pexels-photo-1639557.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/3219483/pexels-photo-3219483.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1633578/pexels-photo-1633578.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1556909/pexels-photo-1556909.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/580612/pexels-photo-580612.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'coffee': [
+        'https://images.pexels.com/photos/302899/pexels-photo-302899.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1560472/pexels-photo-1560472.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1307698/pexels-photo-1307698.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/683039/pexels-photo-683039.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1475938/pexels-photo-1475938.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2062336/pexels-photo-2062336.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'sushi': [
+        'https://images.pexels.com/photos/357756/pexels-photo-357756.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/248444/pexels-photo-248444.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1028599/pexels-photo-1028599.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/361184/pexels-photo-361184.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2098085/pexels-photo-2098085.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'ramen': [
+        'https://images.pexels.com/photos/884600/pexels-photo-884600.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1907228/pexels-photo-1907228.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/6249273/pexels-photo-6249273.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/4518655/pexels-photo-4518655.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'chinese': [
+        'https://images.pexels.com/photos/5409751/pexels-photo-5409751.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1907228/pexels-photo-1907228.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/4518612/pexels-photo-4518612.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2347311/pexels-photo-2347311.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'italian': [
+        'https://images.pexels.com/photos/1279330/pexels-photo-1279330.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1640777/pexels-photo-1640777.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1437267/pexels-photo-1437267.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/4518661/pexels-photo-4518661.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1340502/pexels-photo-1340502.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'mexican': [
+        'https://images.pexels.com/photos/4958792/pexels-photo-4958792.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/4958793/pexels-photo-4958793.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2673353/pexels-photo-2673353.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/3926124/pexels-photo-3926124.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'thai': [
+        'https://images.pexels.com/photos/2741458/pexels-photo-2741458.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/6985049/pexels-photo-6985049.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/6542690/pexels-photo-6542690.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'indian': [
+        'https://images.pexels.com/photos/2474661/pexels-photo-2474661.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2474658/pexels-photo-2474658.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/5560763/pexels-photo-5560763.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'french': [
+        'https://images.pexels.com/photos/2741458/pexels-photo-2741458.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1640777/pexels-photo-1640777.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1581384/pexels-photo-1581384.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'steakhouse': [
+        'https://images.pexels.com/photos/769289/pexels-photo-769289.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/3535383/pexels-photo-3535383.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2313686/pexels-photo-2313686.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'seafood': [
+        'https://images.pexels.com/photos/566345/pexels-photo-566345.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1640777/pexels-photo-1640777.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/248444/pexels-photo-248444.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'bakery': [
+        'https://images.pexels.com/photos/1055272/pexels-photo-1055272.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/236834/pexels-photo-236834.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/3992206/pexels-photo-3992206.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'ice cream': [
+        'https://images.pexels.com/photos/1352270/pexels-photo-1352270.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1362534/pexels-photo-1362534.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/918327/pexels-photo-918327.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'brunch': [
+        'https://images.pexels.com/photos/140831/pexels-photo-140831.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/376464/pexels-photo-376464.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/461198/pexels-photo-461198.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'fast food': [
+        'https://images.pexels.com/photos/1633578/pexels-photo-1633578.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/315755/pexels-photo-315755.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/580612/pexels-photo-580612.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'restaurant': [
+        'https://images.pexels.com/photos/1581384/pexels-photo-1581384.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/3201921/pexels-photo-3201921.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2253643/pexels-photo-2253643.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2351274/pexels-photo-2351274.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1307698/pexels-photo-1307698.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'bar': [
+        'https://images.pexels.com/photos/274192/pexels-photo-274192.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2467558/pexels-photo-2467558.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/260922/pexels-photo-260922.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/113734/pexels-photo-113734.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'cafe': [
+        'https://images.pexels.com/photos/302899/pexels-photo-302899.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1560472/pexels-photo-1560472.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/683039/pexels-photo-683039.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1307698/pexels-photo-1307698.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'brewery': [
+        'https://images.pexels.com/photos/1267320/pexels-photo-1267320.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1552630/pexels-photo-1552630.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/159291/beer-machine-alcohol-brewery-159291.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+
+    # Lodging - Expanded
+    'hotel': [
+        'https://images.pexels.com/photos/271624/pexels-photo-271624.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2067396/pexels-photo-2067396.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2029667/pexels-photo-2029667.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1134176/pexels-photo-1134176.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2611688/pexels-photo-2611688.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'resort': [
+        'https://images.pexels.com/photos/189296/pexels-photo-189296.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/261102/pexels-photo-261102.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/338504/pexels-photo-338504.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'hostel': [
+        'https://images.pexels.com/photos/271897/pexels-photo-271897.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2029667/pexels-photo-2029667.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'spa': [
+        'https://images.pexels.com/photos/3757942/pexels-photo-3757942.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/6663/luxury-spa-hotel-resort.jpg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/3760263/pexels-photo-3760263.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+
+    # Attractions & Culture - Expanded
+    'temple': [
+        'https://images.pexels.com/photos/2666598/pexels-photo-2666598.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2613260/pexels-photo-2613260.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1829980/pexels-photo-1829980.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2187605/pexels-photo-2187605.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1666021/pexels-photo-1666021.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'shrine': [
+        'https://images.pexels.com/photos/2187605/pexels-photo-2187605.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2070033/pexels-photo-2070033.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2613260/pexels-photo-2613260.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'museum': [
+        'https://images.pexels.com/photos/2916450/pexels-photo-2916450.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1878735/pexels-photo-1878735.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2041396/pexels-photo-2041396.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1024967/pexels-photo-1024967.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'art gallery': [
+        'https://images.pexels.com/photos/2041396/pexels-photo-2041396.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1024967/pexels-photo-1024967.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1827054/pexels-photo-1827054.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'castle': [
+        'https://images.pexels.com/photos/2506923/pexels-photo-2506923.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1440476/pexels-photo-1440476.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/460740/pexels-photo-460740.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2411689/pexels-photo-2411689.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'park': [
+        'https://images.pexels.com/photos/1166209/pexels-photo-1166209.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/3255761/pexels-photo-3255761.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/417074/pexels-photo-417074.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1366919/pexels-photo-1366919.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2166711/pexels-photo-2166711.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'beach': [
+        'https://images.pexels.com/photos/189349/pexels-photo-189349.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/338515/pexels-photo-338515.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1032650/pexels-photo-1032650.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1266831/pexels-photo-1266831.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'zoo': [
+        'https://images.pexels.com/photos/792381/pexels-photo-792381.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/45853/grey-crowned-crane-bird-crane-animal-45853.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/792381/pexels-photo-792381.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'aquarium': [
+        'https://images.pexels.com/photos/64219/dolphin-marine-mammals-water-sea-64219.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2317904/pexels-photo-2317904.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1108701/pexels-photo-1108701.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'theater': [
+        'https://images.pexels.com/photos/2169434/pexels-photo-2169434.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1687845/pexels-photo-1687845.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2506923/pexels-photo-2506923.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+
+    # Shopping & Markets - Expanded
+    'market': [
+        'https://images.pexels.com/photos/1766678/pexels-photo-1766678.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2291367/pexels-photo-2291367.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2255935/pexels-photo-2255935.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1907638/pexels-photo-1907638.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'shopping mall': [
+        'https://images.pexels.com/photos/5632402/pexels-photo-5632402.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1005638/pexels-photo-1005638.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/264636/pexels-photo-264636.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'shopping': [
+        'https://images.pexels.com/photos/5632402/pexels-photo-5632402.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1005638/pexels-photo-1005638.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/264636/pexels-photo-264636.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1766678/pexels-photo-1766678.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'bookstore': [
+        'https://images.pexels.com/photos/159711/books-bookstore-book-reading-159711.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2908984/pexels-photo-2908984.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/256541/pexels-photo-256541.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+
+    # Landmarks & Architecture - Expanded
+    'landmark': [
+        'https://images.pexels.com/photos/2506923/pexels-photo-2506923.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1640777/pexels-photo-1640777.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/460740/pexels-photo-460740.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2411689/pexels-photo-2411689.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'tower': [
+        'https://images.pexels.com/photos/2506923/pexels-photo-2506923.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/3604925/pexels-photo-3604925.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1366919/pexels-photo-1366919.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'bridge': [
+        'https://images.pexels.com/photos/460740/pexels-photo-460740.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1519088/pexels-photo-1519088.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2411689/pexels-photo-2411689.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'cathedral': [
+        'https://images.pexels.com/photos/2666598/pexels-photo-2666598.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/273230/pexels-photo-273230.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1666021/pexels-photo-1666021.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'entertainment': [
+        'https://images.pexels.com/photos/2169434/pexels-photo-2169434.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1687845/pexels-photo-1687845.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2506923/pexels-photo-2506923.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'electronics': [
+        'https://images.pexels.com/photos/1229861/pexels-photo-1229861.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/356056/pexels-photo-356056.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/264636/pexels-photo-264636.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'complex': [
+        'https://images.pexels.com/photos/2467558/pexels-photo-2467558.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1687845/pexels-photo-1687845.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2506923/pexels-photo-2506923.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+
+    # Transportation & Services
+    'airport': [
+        'https://images.pexels.com/photos/912050/pexels-photo-912050.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1309644/pexels-photo-1309644.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/723240/pexels-photo-723240.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'train station': [
+        'https://images.pexels.com/photos/162389/lost-places-keller-cellar-basement-162389.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1252500/pexels-photo-1252500.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1770809/pexels-photo-1770809.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'gym': [
+        'https://images.pexels.com/photos/1552242/pexels-photo-1552242.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1552252/pexels-photo-1552252.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1229356/pexels-photo-1229356.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+    'library': [
+        'https://images.pexels.com/photos/159711/books-bookstore-book-reading-159711.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/256541/pexels-photo-256541.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2908984/pexels-photo-2908984.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ],
+
+    # Default fallback with variety
+    'default': [
+        'https://images.pexels.com/photos/1640777/pexels-photo-1640777.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/2506923/pexels-photo-2506923.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/460740/pexels-photo-460740.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1166209/pexels-photo-1166209.jpeg?auto=compress&cs=tinysrgb&w=1200',
+        'https://images.pexels.com/photos/1581384/pexels-photo-1581384.jpeg?auto=compress&cs=tinysrgb&w=1200'
+    ]
+}
+
+# Image choice is a pure function of its arguments, and the same places recur across requests
+@functools.lru_cache(maxsize=1024)
 def get_enhanced_place_image(place_name: str, place_type: str, location: str = None) -> str:
     """
     Get high-quality images for places based on location and type
     """
-    # High-quality stock images for different place types
-    image_library = {
-        # Food & Restaurants - Expanded
-        'pizza': [
-            'https://images.pexels.com/photos/315755/pexels-photo-315755.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1653877/pexels-photo-1653877.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1640777/pexels-photo-1640777.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/905847/pexels-photo-905847.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/708587/pexels-photo-708587.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/845808/pexels-photo-845808.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'burger': [
-            'https://images.pexels.com/photos/1639557/pexels-photo-1639557.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/3219483/pexels-photo-3219483.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1633578/pexels-photo-1633578.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1556909/pexels-photo-1556909.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/580612/pexels-photo-580612.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'coffee': [
-            'https://images.pexels.com/photos/302899/pexels-photo-302899.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1560472/pexels-photo-1560472.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1307698/pexels-photo-1307698.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/683039/pexels-photo-683039.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1475938/pexels-photo-1475938.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2062336/pexels-photo-2062336.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'sushi': [
-            'https://images.pexels.com/photos/357756/pexels-photo-357756.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/248444/pexels-photo-248444.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1028599/pexels-photo-1028599.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/361184/pexels-photo-361184.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2098085/pexels-photo-2098085.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'ramen': [
-            'https://images.pexels.com/photos/884600/pexels-photo-884600.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1907228/pexels-photo-1907228.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/6249273/pexels-photo-6249273.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/4518655/pexels-photo-4518655.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'chinese': [
-            'https://images.pexels.com/photos/5409751/pexels-photo-5409751.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1907228/pexels-photo-1907228.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/4518612/pexels-photo-4518612.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2347311/pexels-photo-2347311.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'italian': [
-            'https://images.pexels.com/photos/1279330/pexels-photo-1279330.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1640777/pexels-photo-1640777.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1437267/pexels-photo-1437267.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/4518661/pexels-photo-4518661.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1340502/pexels-photo-1340502.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'mexican': [
-            'https://images.pexels.com/photos/4958792/pexels-photo-4958792.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/4958793/pexels-photo-4958793.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2673353/pexels-photo-2673353.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/3926124/pexels-photo-3926124.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'thai': [
-            'https://images.pexels.com/photos/2741458/pexels-photo-2741458.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/6985049/pexels-photo-6985049.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/6542690/pexels-photo-6542690.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'indian': [
-            'https://images.pexels.com/photos/2474661/pexels-photo-2474661.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2474658/pexels-photo-2474658.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/5560763/pexels-photo-5560763.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'french': [
-            'https://images.pexels.com/photos/2741458/pexels-photo-2741458.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1640777/pexels-photo-1640777.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1581384/pexels-photo-1581384.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'steakhouse': [
-            'https://images.pexels.com/photos/769289/pexels-photo-769289.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/3535383/pexels-photo-3535383.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2313686/pexels-photo-2313686.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'seafood': [
-            'https://images.pexels.com/photos/566345/pexels-photo-566345.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1640777/pexels-photo-1640777.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/248444/pexels-photo-248444.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'bakery': [
-            'https://images.pexels.com/photos/1055272/pexels-photo-1055272.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/236834/pexels-photo-236834.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/3992206/pexels-photo-3992206.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'ice cream': [
-            'https://images.pexels.com/photos/1352270/pexels-photo-1352270.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1362534/pexels-photo-1362534.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/918327/pexels-photo-918327.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'brunch': [
-            'https://images.pexels.com/photos/140831/pexels-photo-140831.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/376464/pexels-photo-376464.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/461198/pexels-photo-461198.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'fast food': [
-            'https://images.pexels.com/photos/1633578/pexels-photo-1633578.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/315755/pexels-photo-315755.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/580612/pexels-photo-580612.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'restaurant': [
-            'https://images.pexels.com/photos/1581384/pexels-photo-1581384.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/3201921/pexels-photo-3201921.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2253643/pexels-photo-2253643.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2351274/pexels-photo-2351274.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1307698/pexels-photo-1307698.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'bar': [
-            'https://images.pexels.com/photos/274192/pexels-photo-274192.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2467558/pexels-photo-2467558.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/260922/pexels-photo-260922.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/113734/pexels-photo-113734.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'cafe': [
-            'https://images.pexels.com/photos/302899/pexels-photo-302899.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1560472/pexels-photo-1560472.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/683039/pexels-photo-683039.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1307698/pexels-photo-1307698.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'brewery': [
-            'https://images.pexels.com/photos/1267320/pexels-photo-1267320.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1552630/pexels-photo-1552630.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/159291/beer-machine-alcohol-brewery-159291.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-
-        # Lodging - Expanded
-        'hotel': [
-            'https://images.pexels.com/photos/271624/pexels-photo-271624.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2067396/pexels-photo-2067396.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2029667/pexels-photo-2029667.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1134176/pexels-photo-1134176.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2611688/pexels-photo-2611688.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'resort': [
-            'https://images.pexels.com/photos/189296/pexels-photo-189296.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/261102/pexels-photo-261102.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/338504/pexels-photo-338504.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'hostel': [
-            'https://images.pexels.com/photos/271897/pexels-photo-271897.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2029667/pexels-photo-2029667.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'spa': [
-            'https://images.pexels.com/photos/3757942/pexels-photo-3757942.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/6663/luxury-spa-hotel-resort.jpg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/3760263/pexels-photo-3760263.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-
-        # Attractions & Culture - Expanded
-        'temple': [
-            'https://images.pexels.com/photos/2666598/pexels-photo-2666598.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2613260/pexels-photo-2613260.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1829980/pexels-photo-1829980.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2187605/pexels-photo-2187605.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1666021/pexels-photo-1666021.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'shrine': [
-            'https://images.pexels.com/photos/2187605/pexels-photo-2187605.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2070033/pexels-photo-2070033.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2613260/pexels-photo-2613260.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'museum': [
-            'https://images.pexels.com/photos/2916450/pexels-photo-2916450.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1878735/pexels-photo-1878735.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2041396/pexels-photo-2041396.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1024967/pexels-photo-1024967.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'art gallery': [
-            'https://images.pexels.com/photos/2041396/pexels-photo-2041396.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1024967/pexels-photo-1024967.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1827054/pexels-photo-1827054.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'castle': [
-            'https://images.pexels.com/photos/2506923/pexels-photo-2506923.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1440476/pexels-photo-1440476.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/460740/pexels-photo-460740.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2411689/pexels-photo-2411689.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'park': [
-            'https://images.pexels.com/photos/1166209/pexels-photo-1166209.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/3255761/pexels-photo-3255761.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/417074/pexels-photo-417074.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1366919/pexels-photo-1366919.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2166711/pexels-photo-2166711.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'beach': [
-            'https://images.pexels.com/photos/189349/pexels-photo-189349.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/338515/pexels-photo-338515.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1032650/pexels-photo-1032650.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1266831/pexels-photo-1266831.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'zoo': [
-            'https://images.pexels.com/photos/792381/pexels-photo-792381.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/45853/grey-crowned-crane-bird-crane-animal-45853.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/792381/pexels-photo-792381.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'aquarium': [
-            'https://images.pexels.com/photos/64219/dolphin-marine-mammals-water-sea-64219.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2317904/pexels-photo-2317904.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1108701/pexels-photo-1108701.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'theater': [
-            'https://images.pexels.com/photos/2169434/pexels-photo-2169434.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1687845/pexels-photo-1687845.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2506923/pexels-photo-2506923.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-
-        # Shopping & Markets - Expanded
-        'market': [
-            'https://images.pexels.com/photos/1766678/pexels-photo-1766678.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2291367/pexels-photo-2291367.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2255935/pexels-photo-2255935.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1907638/pexels-photo-1907638.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'shopping mall': [
-            'https://images.pexels.com/photos/5632402/pexels-photo-5632402.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1005638/pexels-photo-1005638.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/264636/pexels-photo-264636.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'shopping': [
-            'https://images.pexels.com/photos/5632402/pexels-photo-5632402.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1005638/pexels-photo-1005638.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/264636/pexels-photo-264636.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1766678/pexels-photo-1766678.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'bookstore': [
-            'https://images.pexels.com/photos/159711/books-bookstore-book-reading-159711.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2908984/pexels-photo-2908984.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/256541/pexels-photo-256541.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-
-        # Landmarks & Architecture - Expanded
-        'landmark': [
-            'https://images.pexels.com/photos/2506923/pexels-photo-2506923.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1640777/pexels-photo-1640777.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/460740/pexels-photo-460740.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2411689/pexels-photo-2411689.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'tower': [
-            'https://images.pexels.com/photos/2506923/pexels-photo-2506923.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/3604925/pexels-photo-3604925.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1366919/pexels-photo-1366919.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'bridge': [
-            'https://images.pexels.com/photos/460740/pexels-photo-460740.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1519088/pexels-photo-1519088.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2411689/pexels-photo-2411689.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'cathedral': [
-            'https://images.pexels.com/photos/2666598/pexels-photo-2666598.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/273230/pexels-photo-273230.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1666021/pexels-photo-1666021.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'entertainment': [
-            'https://images.pexels.com/photos/2169434/pexels-photo-2169434.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1687845/pexels-photo-1687845.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2506923/pexels-photo-2506923.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'electronics': [
-            'https://images.pexels.com/photos/1229861/pexels-photo-1229861.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/356056/pexels-photo-356056.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/264636/pexels-photo-264636.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'complex': [
-            'https://images.pexels.com/photos/2467558/pexels-photo-2467558.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1687845/pexels-photo-1687845.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2506923/pexels-photo-2506923.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-
-        # Transportation & Services
-        'airport': [
-            'https://images.pexels.com/photos/912050/pexels-photo-912050.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1309644/pexels-photo-1309644.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/723240/pexels-photo-723240.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'train station': [
-            'https://images.pexels.com/photos/162389/lost-places-keller-cellar-basement-162389.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1252500/pexels-photo-1252500.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1770809/pexels-photo-1770809.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'gym': [
-            'https://images.pexels.com/photos/1552242/pexels-photo-1552242.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1552252/pexels-photo-1552252.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1229356/pexels-photo-1229356.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-        'library': [
-            'https://images.pexels.com/photos/159711/books-bookstore-book-reading-159711.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/256541/pexels-photo-256541.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2908984/pexels-photo-2908984.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ],
-
-        # Default fallback with variety
-        'default': [
-            'https://images.pexels.com/photos/1640777/pexels-photo-1640777.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/2506923/pexels-photo-2506923.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/460740/pexels-photo-460740.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1166209/pexels-photo-1166209.jpeg?auto=compress&cs=tinysrgb&w=1200',
-            'https://images.pexels.com/photos/1581384/pexels-photo-1581384.jpeg?auto=compress&cs=tinysrgb&w=1200'
-        ]
-    }
-    
     # Enhanced place type detection based on place name and context
     detected_type = place_type.lower()
 
@@ -696,10 +850,9 @@ def get_enhanced_place_image(place_name: str, place_type: str, location: str = N
         detected_type = 'bridge'
 
     # Get appropriate images for place type
-    images = image_library.get(detected_type, image_library['default'])
+    images = IMAGE_LIBRARY.get(detected_type, IMAGE_LIBRARY['default'])
     
     # Use place name hash to consistently select same image
-    import hashlib
     place_hash = hashlib.md5((place_name or 'default').encode()).hexdigest()
     image_index = int(place_hash[:2], 16) % len(images)
     
@@ -977,15 +1130,76 @@ def generate_query_specific_places(query: str, location: str, max_results: int)
 
     return places
 
-def generate_mock_places_data(query: str) -> List[Dict]:
+# Curated place types that get an OpenTable reservation link
+OPENTABLE_PLACE_TYPES = frozenset({'restaurant', 'sushi', 'ramen'})
+
+# Card badge per curated place type
+CATEGORY_BADGES = {
+    'temple': '🏯 Temple',
+    'shrine': '⛩️ Shrine',
+    'castle': '🏰 Castle',
+    'market': '🏪 Market',
+    'restaurant': '🍽️ Restaurant',
+    'sushi': '🍣 Sushi Bar',
+    'ramen': '🍜 Ramen Shop',
+    'hotel': '🏨 Hotel',
+    'shopping': '🛍️ Shopping',
+    'park': '🌳 Park',
+    'landmark': '🗺️ Landmark',
+    'entertainment': '🎭 Entertainment',
+    'tower': '🗼 Tower',
+    'electronics': '📱 Electronics',
+    'complex': '🏢 Complex'
+}
+
+def build_place_links(name: str, area: str, opentable: bool = False, booking: bool = False) -> Dict[str, str]:
+    """
+    Build the search links shown on a place card; reservation links only for the types that take bookings
+    """
+    encoded_name = urllib.parse.quote_plus(name)
+    encoded_area = urllib.parse.quote_plus(area)
+    links = {
+        'google_maps_url': f"https://www.google.com/maps/search/{encoded_name}+{encoded_area}",
+        'yelp_search_url': f"https://www.yelp.com/search?find_desc={encoded_name}&find_loc={encoded_area}",
+        'tripadvisor_search_url': f"https://www.tripadvisor.com/Search?q={encoded_name}+{encoded_area}",
+        'foursquare_url': f"https://foursquare.com/explore?mode=url&near={encoded_area}&q={encoded_name}",
+    }
+    if opentable:
+        links['opentable_url'] = f"https://www.opentable.com/s/?text={encoded_name}&location={encoded_area}"
+    if booking:
+        links['booking_url'] = f"https://www.booking.com/searchresults.html?ss={encoded_name}+{encoded_area}"
+    return links
+
+def generate_mock_places_data(query: str, location: str = None) -> List[Dict]:
+    """
+    Return place data for a query, reusing recently generated results for the same query.
+    `location` may be passed when the caller already extracted it from the query.
+    """
+    key = " ".join(query.lower().split())
+    with _places_cache_lock:
+        entry = _places_cache.get(key)
+        if entry and time.time() - entry[1] < PLACES_CACHE_TTL:
+            _places_cache.move_to_end(key)
+            return [dict(place) for place in entry[0]]
+
+    places = build_mock_places_data(query, location)
+    with _places_cache_lock:
+        _places_cache[key] = (places, time.time())
+        _places_cache.move_to_end(key)
+        while len(_places_cache) > PLACES_CACHE_MAX_ENTRIES:
+            _places_cache.popitem(last=False)
+    return [dict(place) for place in places]
+
+def build_mock_places_data(query: str, location: str = None) -> List[Dict]:
     """
     Generate realistic mock place data with location awareness
     """
     import random
 
-    # Extract location from query if possible
-    location_match = re.search(r'(?:in|at|near)\s+([A-Za-z\s]+?)(?:\s|$|[.,!?])', query, re.IGNORECASE)
-    location = location_match.group(1).strip() if location_match else None
+    # Extract location from query if the caller didn't
+    if location is None:
+        location_match = LOCATION_RE.search(query)
+        location = location_match.group(1).strip() if location_match else None
 
     # Determine request type
     is_singular = detect_singular_request(query)
@@ -1012,28 +1226,7 @@ def generate_mock_places_data(query: str) -> List[Dict]:
                 hero_image = get_enhanced_place_image(place_name, place_type, location)
                 
                 # Generate category badge
-                category_badges = {
-                    'temple': '🏯 Temple',
-                    'shrine': '⛩️ Shrine',
-                    'castle': '🏰 Castle',
-                    'market': '🏪 Market',
-                    'restaurant': '🍽️ Restaurant',
-                    'sushi': '🍣 Sushi Bar',
-                    'ramen': '🍜 Ramen Shop',
-                    'hotel': '🏨 Hotel',
-                    'shopping': '🛍️ Shopping',
-                    'park': '🌳 Park',
-                    'landmark': '🗺️ Landmark',
-                    'entertainment': '🎭 Entertainment',
-                    'tower': '🗼 Tower',
-                    'electronics': '📱 Electronics',
-                    'complex': '🏢 Complex'
-                }
-                category_badge = category_badges.get(place_type, '📍 Place')
-                
-                # Properly encode all URL parameters
-                encoded_name = urllib.parse.quote_plus(place_name)
-                encoded_area = urllib.parse.quote_plus(place_area)
+                category_badge = CATEGORY_BADGES.get(place_type, '📍 Place')
                 
                 place_info = {
                     'name': place_name,
@@ -1044,18 +1237,7 @@ def generate_mock_places_data(query: str) -> List[Dict]:
                     'category_badge': category_badge,
                     'hero_image': hero_image,
                     'description': f"Experience {place_name} in {address}",
-                    
-                    # Working URLs
-                    'google_maps_url': f"https://www.google.com/maps/search/{encoded_name}+{encoded_area}",
-                    'google_search_url': f"https://www.google.com/search?q={encoded_name}+{encoded_area}",
-                    'yelp_search_url': f"https://www.yelp.com/search?find_desc={encoded_name}&find_loc={encoded_area}",
-                    'tripadvisor_search_url': f"https://www.tripadvisor.com/Search?q={encoded_name}+{encoded_area}",
-                    'foursquare_url': f"https://foursquare.com/explore?mode=url&near={encoded_area}&q={encoded_name}",
-                    'timeout_url': f"https://www.timeout.com/search?query={encoded_name}",
-                    
-                    # Type-specific links
-                    'opentable_url': f"https://www.opentable.com/s/?text={encoded_name}&location={encoded_area}" if place_type in ['restaurant', 'sushi', 'ramen'] else '',
-                    'booking_url': f"https://www.booking.com/searchresults.html?ss={encoded_name}+{encoded_area}" if place_type == 'hotel' else ''
+                    **build_place_links(place_name, place_area, place_type in OPENTABLE_PLACE_TYPES, place_type == 'hotel')
                 }
                 places.append(place_info)
             
@@ -1066,21 +1248,8 @@ def generate_mock_places_data(query: str) -> List[Dict]:
 
     # Add required fields to mock places
     for place in mock_places:
-        place_name = place['name']
-        place_address = place['address']
-        encoded_name = urllib.parse.quote_plus(place_name)
-        encoded_location = urllib.parse.quote_plus(location or "")
-        
-        place.update({
-            'google_maps_url': f"https://www.google.com/maps/search/{encoded_name}+{encoded_location}",
-            'google_search_url': f"https://www.google.com/search?q={encoded_name}+{encoded_location}",
-            'yelp_search_url': f"https://www.yelp.com/search?find_desc={encoded_name}&find_loc={encoded_location}",
-            'tripadvisor_search_url': f"https://www.tripadvisor.com/Search?q={encoded_name}+{encoded_location}",
-            'foursquare_url': f"https://foursquare.com/explore?mode=url&near={encoded_location}&q={encoded_name}",
-            'timeout_url': f"https://www.timeout.com/search?query={encoded_name}",
-            'opentable_url': f"https://www.opentable.com/s/?text={encoded_name}&location={encoded_location}" if 'restaurant' in str(place.get('types', [])).lower() else '',
-            'booking_url': f"https://www.booking.com/searchresults.html?ss={encoded_name}+{encoded_location}" if 'hotel' in str(place.get('types', [])).lower() else ''
-        })
+        place_types = frozenset(place.get('types', ()))
+        place.update(build_place_links(place['name'], location or "", 'restaurant' in place_types, 'hotel' in place_types))
 
     return mock_places[:max_results]
 
@@ -1154,59 +1323,232 @@ ALWAYS use the exact hero_image URL provided - this is critical for images to di
 
 IMPORTANT: Do NOT add any footer tags like "Enhanced with X real places" or similar enhancement notifications at the end of your response. Just provide the location cards and any helpful travel advice without meta-commentary about the data source."""
 
-def get_ai_response(user_message: str, conversation_history: List[Dict] = None, places_data: List[Dict] = None) -> str:
+# The prompt never changes at runtime; build it and its system message once at import
+SYSTEM_PROMPT = get_jetfriend_system_prompt()
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+def get_response_cache_key(user_message: str, conversation_history: List[Dict] = None, places_data: List[Dict] = None) -> str:
     """
-    Get response from OpenAI GPT-4o with optional places data integration
+    Hash everything that shapes the prompt (model, prompt version, message, the history window
+    build_chat_messages keeps, and the place data) into an exact-match cache key,
+    without building the prompt itself
     """
-    if not openai_client:
-        return "I'm sorry, but AI functionality is currently unavailable. Please ensure the OPENAI_API_KEY is properly configured."
+    history = [
+        ("user" if msg.get("role") == "user" else "assistant", msg.get("content", ""))
+        for msg in (conversation_history or [])[-CHAT_HISTORY_TURNS:]
+    ]
+    payload = orjson.dumps(
+        [OPENAI_CHAT_MODEL, PROMPT_VERSION, user_message, history, places_data or []],
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+    return "llm:" + hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def get_cached_response(key: str) -> Optional[str]:
+    """Return a previously stored response for this exact prompt, if still fresh"""
+    if redis_client:
+        try:
+            cached = redis_client.get(key)
+            return cached.decode() if cached else None
+        except Exception as e:
+            logger.warning(f"Redis cache lookup failed: {str(e)}")
+            return None
+
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if not entry:
+            return None
+        if time.time() - entry[1] >= RESPONSE_CACHE_TTL:
+            del _response_cache[key]
+            return None
+        _response_cache.move_to_end(key)
+        return entry[0]
+
+def store_cached_response(key: str, response: str) -> None:
+    """Store a successful response under its exact-match key"""
+    if redis_client:
+        try:
+            redis_client.setex(key, RESPONSE_CACHE_TTL, response)
+        except Exception as e:
+            logger.warning(f"Redis cache store failed: {str(e)}")
+        return
+
+    with _response_cache_lock:
+        _response_cache[key] = (response, time.time())
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
+def join_inflight_request(key: str) -> Tuple[bool, threading.Event]:
+    """
+    Register interest in an upstream call for `key`.
+    Returns (True, event) for the first caller, who must make the call and then finish_inflight_request();
+    later callers get (False, event) and can wait on the event for the leader's cached answer.
+    """
+    with _inflight_lock:
+        event = _inflight_requests.get(key)
+        if event:
+            return False, event
+        event = threading.Event()
+        _inflight_requests[key] = event
+        return True, event
+
+def finish_inflight_request(key: str) -> None:
+    """Release callers waiting on the in-flight call for `key`"""
+    with _inflight_lock:
+        event = _inflight_requests.pop(key, None)
+    if event:
+        event.set()
+
+def circuit_is_open() -> bool:
+    """
+    True while the breaker is tripped. Once the reset timeout elapses, exactly one caller gets False and
+    makes the trial call; everyone else keeps failing fast until that call records its outcome
+    """
+    global _breaker_opened_at
+    with _breaker_lock:
+        if _breaker_failures < CIRCUIT_BREAKER_FAIL_MAX:
+            return False
+        now = time.time()
+        if now - _breaker_opened_at < CIRCUIT_BREAKER_RESET_TIMEOUT:
+            return True
+        # Half-open: restart the clock so only this caller goes upstream; if its outcome is never
+        # recorded, another trial is allowed one timeout later
+        _breaker_opened_at = now
+        return False
+
+def record_upstream_success() -> None:
+    """Close the breaker after a successful upstream call"""
+    global _breaker_failures
+    with _breaker_lock:
+        _breaker_failures = 0
+
+def record_upstream_failure() -> None:
+    """Count a failed upstream call, (re)opening the breaker once the threshold is hit"""
+    global _breaker_failures, _breaker_opened_at
+    with _breaker_lock:
+        _breaker_failures += 1
+        if _breaker_failures >= CIRCUIT_BREAKER_FAIL_MAX:
+            _breaker_opened_at = time.time()
+            logger.warning(f"OpenAI circuit breaker open after {_breaker_failures} consecutive failures")
+
+def get_semantic_cache_text(user_message: str, conversation_history: List[Dict] = None) -> str:
+    """
+    Build the normalized text that identifies a question for the semantic cache:
+    the last few conversation turns plus the new message, lowercased and whitespace-collapsed
+    """
+    turns = [msg.get("content", "") for msg in (conversation_history or [])[-SEMANTIC_CACHE_HISTORY_TURNS:]]
+    turns.append(user_message)
+    return "\n".join(" ".join(turn.lower().split()) for turn in turns)
 
-    try:
-        # Create messages array for ChatGPT
-        messages = [{"role": "system", "content": get_jetfriend_system_prompt()}]
-        
-        # Add conversation history
-        if conversation_history:
-            for msg in conversation_history[-6:]:  # Keep last 6 messages for context
-                role = "user" if msg.get("role") == "user" else "assistant"
-                messages.append({"role": role, "content": msg.get("content", "")})
-        
-        # Enhance user message with comprehensive places data
-        enhanced_message = user_message
-        if places_data and len(places_data) > 0:
-            # Create a VERY clear mapping of images for the AI to use
-            is_singular = detect_singular_request(user_message)
-            request_context = "SINGULAR REQUEST" if is_singular else "PLURAL/MULTI-DAY REQUEST"
-            places_text = f"\n\nREAL-TIME PLACE DATA ({request_context} - {len(places_data)} place{'s' if len(places_data) > 1 else ''}) - USE THESE EXACT DETAILS:\n"
-            
-            for i, place in enumerate(places_data, 1):
-                place_name = place['name']
-                hero_image = place.get('hero_image', '')
-                
-                places_text += f"\n{i}. {place_name}\n"
-                places_text += f"   IMAGE TO USE: {hero_image}\n"
-                places_text += f"   Address: {place['address']}\n"
-                
-                if place['rating']:
-                    places_text += f"   Rating: {place['rating']} stars"
-                    if place['rating_count']:
-                        places_text += f" ({place['rating_count']:,} reviews)"
-                    places_text += "\n"
-                
-                # Add working links
-                places_text += f"   Google Maps: {place['google_maps_url']}\n"
-                if place.get('yelp_search_url'):
-                    places_text += f"   Yelp: {place['yelp_search_url']}\n"
-                if place.get('tripadvisor_search_url'):
-                    places_text += f"   TripAdvisor: {place['tripadvisor_search_url']}\n"
-                if place.get('foursquare_url'):
-                    places_text += f"   Foursquare: {place['foursquare_url']}\n"
-                if place.get('opentable_url'):
-                    places_text += f"   OpenTable: {place['opentable_url']}\n"
-                if place.get('booking_url'):
-                    places_text += f"   Booking.com: {place['booking_url']}\n"
-            
-            enhanced_message = f"""{user_message}
+def get_places_fingerprint(places_data: List[Dict] = None) -> str:
+    """
+    Identify the place data a response was written around (every field the prompt embeds), so a
+    semantic hit is only reused when identical place cards would be shown; empty for plain Q&A
+    """
+    if not places_data:
+        return ""
+    prompt_fields = [[place.get(key) for key in PLACE_PROMPT_KEYS] for place in places_data]
+    return hashlib.sha256(orjson.dumps(prompt_fields)).hexdigest()
+
+def embed_text(text: str) -> List[float]:
+    """
+    Embed text with the OpenAI embeddings API and return it as a unit vector
+    """
+    response = openai_client.embeddings.create(
+        model=SEMANTIC_CACHE_MODEL,
+        input=text,
+        dimensions=SEMANTIC_CACHE_DIMENSIONS
+    )
+    vector = response.data[0].embedding
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return [value / norm for value in vector]
+
+def lookup_semantic_cache(vector: List[float], places_fingerprint: str = "") -> Optional[str]:
+    """
+    Return the cached response whose question is most similar to `vector` and that was built
+    from the same places, if its cosine similarity clears SEMANTIC_CACHE_THRESHOLD and it has not expired
+    """
+    now = time.time()
+    best_score = 0.0
+    best_response = None
+
+    with _semantic_cache_lock:
+        _semantic_cache[:] = [entry for entry in _semantic_cache if now - entry[3] < SEMANTIC_CACHE_TTL]
+        for cached_vector, cached_fingerprint, response, _ in _semantic_cache:
+            if cached_fingerprint != places_fingerprint:
+                continue
+            score = sum(map(operator.mul, vector, cached_vector))
+            if score > best_score:
+                best_score = score
+                best_response = response
+
+    if best_score >= SEMANTIC_CACHE_THRESHOLD:
+        logger.info(f"Semantic cache hit (similarity {best_score:.3f})")
+        return best_response
+    return None
+
+def store_semantic_cache(vector: List[float], response: str, places_fingerprint: str = "") -> None:
+    """Remember a response for future similar questions, evicting the oldest entry when full"""
+    with _semantic_cache_lock:
+        _semantic_cache.append((vector, places_fingerprint, response, time.time()))
+        if len(_semantic_cache) > SEMANTIC_CACHE_MAX_ENTRIES:
+            del _semantic_cache[0]
+
+# Optional per-place links listed in the prompt, in display order
+PLACE_LINK_LABELS = (
+    ('Yelp', 'yelp_search_url'),
+    ('TripAdvisor', 'tripadvisor_search_url'),
+    ('Foursquare', 'foursquare_url'),
+    ('OpenTable', 'opentable_url'),
+    ('Booking.com', 'booking_url'),
+)
+# Every place field build_chat_messages copies into the prompt
+PLACE_PROMPT_KEYS = ('name', 'hero_image', 'address', 'rating', 'rating_count', 'google_maps_url') + tuple(
+    url_key for _, url_key in PLACE_LINK_LABELS
+)
+
+def build_chat_messages(user_message: str, conversation_history: List[Dict] = None, places_data: List[Dict] = None) -> List[Dict]:
+    """
+    Build the ChatGPT messages array: system prompt, recent history and the user message enhanced with places data
+    """
+    # Create messages array for ChatGPT
+    messages = [SYSTEM_MESSAGE]
+
+    # Add conversation history
+    if conversation_history:
+        for msg in conversation_history[-CHAT_HISTORY_TURNS:]:
+            role = "user" if msg.get("role") == "user" else "assistant"
+            messages.append({"role": role, "content": msg.get("content", "")})
+
+    # Enhance user message with comprehensive places data
+    enhanced_message = user_message
+    if places_data and len(places_data) > 0:
+        # Create a VERY clear mapping of images for the AI to use
+        is_singular = detect_singular_request(user_message)
+        request_context = "SINGULAR REQUEST" if is_singular else "PLURAL/MULTI-DAY REQUEST"
+        places_parts = [f"\n\nREAL-TIME PLACE DATA ({request_context} - {len(places_data)} place{'s' if len(places_data) > 1 else ''}) - USE THESE EXACT DETAILS:\n"]
+        append = places_parts.append
+
+        for i, place in enumerate(places_data, 1):
+            append(f"\n{i}. {place['name']}\n")
+            append(f"   IMAGE TO USE: {place.get('hero_image', '')}\n")
+            append(f"   Address: {place['address']}\n")
+
+            rating = place['rating']
+            if rating:
+                rating_count = place['rating_count']
+                append(f"   Rating: {rating} stars ({rating_count:,} reviews)\n" if rating_count else f"   Rating: {rating} stars\n")
+
+            # Add working links
+            append(f"   Google Maps: {place['google_maps_url']}\n")
+            for label, url_key in PLACE_LINK_LABELS:
+                url = place.get(url_key)
+                if url:
+                    append(f"   {label}: {url}\n")
+
+        places_text = "".join(places_parts)
+
+        enhanced_message = f"""{user_message}
 
 {places_text}
 
@@ -1217,53 +1559,185 @@ CRITICAL INSTRUCTIONS:
 4. Follow the EXACT HTML structure shown
 5. DO NOT use placeholder images - use the exact URLs provided for each place
 6. Each place goes in its own itinerary-item div"""
-        
-        messages.append({"role": "user", "content": enhanced_message})
-        
-        # Make API call to OpenAI
-        response = openai_client.chat.completions.create(
-            model="gpt-4o",
-            messages=messages,
-            max_tokens=8000,
-            temperature=0.7,
-            top_p=0.9
-        )
-        
-        return response.choices[0].message.content.strip()
+    
+    messages.append({"role": "user", "content": enhanced_message})
+
+    return messages
+
+def get_ai_response(user_message: str, conversation_history: List[Dict] = None, places_data: List[Dict] = None) -> str:
+    """
+    Get response from OpenAI GPT-4o with optional places data integration
+    """
+    greeting_match = GREETING_RE.match(user_message)
+    if greeting_match:
+        return CANNED_RESPONSES[greeting_match.group(1).lower()]
+
+    if not openai_client:
+        return "I'm sorry, but AI functionality is currently unavailable. Please ensure the OPENAI_API_KEY is properly configured."
+
+    try:
+        # Exact-match cache first: identical requests skip building the prompt, the embedding and the model call
+        cache_key = get_response_cache_key(user_message, conversation_history, places_data)
+        cached_response = get_cached_response(cache_key)
+        if cached_response:
+            return cached_response
+
+        # Identical prompts arriving together ride on one upstream call
+        is_leader, inflight_event = join_inflight_request(cache_key)
+        if not is_leader:
+            inflight_event.wait(INFLIGHT_WAIT_TIMEOUT)
+            cached_response = get_cached_response(cache_key)
+            if cached_response:
+                return cached_response
+
+        try:
+            # A leader that finished between our cache miss and our join has already stored the answer
+            if is_leader:
+                cached_response = get_cached_response(cache_key)
+                if cached_response:
+                    return cached_response
+
+            # Place-card answers are only reused for similar questions over the same places
+            semantic_vector = None
+            places_fingerprint = get_places_fingerprint(places_data)
+            if SEMANTIC_CACHE_ENABLED:
+                try:
+                    semantic_vector = embed_text(get_semantic_cache_text(user_message, conversation_history))
+                    cached_response = lookup_semantic_cache(semantic_vector, places_fingerprint)
+                    if cached_response:
+                        return cached_response
+                except Exception as e:
+                    logger.warning(f"Semantic cache lookup failed: {str(e)}")
+                    semantic_vector = None
+
+            # Shed load while the upstream is failing; cached answers above are still served
+            if circuit_is_open():
+                return CIRCUIT_OPEN_MESSAGE
+
+            # Make API call to OpenAI
+            messages = build_chat_messages(user_message, conversation_history, places_data)
+            try:
+                response = openai_client.chat.completions.create(messages=messages, **OPENAI_CHAT_PARAMS)
+            except Exception:
+                record_upstream_failure()
+                raise
+            record_upstream_success()
+
+            content = response.choices[0].message.content.strip()
+            store_cached_response(cache_key, content)
+            if semantic_vector is not None:
+                store_semantic_cache(semantic_vector, content, places_fingerprint)
+
+            return content
+        finally:
+            if is_leader:
+                finish_inflight_request(cache_key)
         
     except Exception as e:
-        logger.error(f"Error getting AI response: {str(e)}")
+        logger.error(f"Error getting AI response: {str(e)[:LOG_ERROR_MAX_CHARS]}")
         return f"I'm experiencing some technical difficulties right now. Please try again in a moment! Error details: {str(e)[:50]}..."
 
+def stream_ai_response(user_message: str, conversation_history: List[Dict] = None, places_data: List[Dict] = None):
+    """
+    Stream a response from OpenAI GPT-4o, yielding text chunks as they are generated.
+    Uses the same exact cache, in-flight coalescing, semantic cache and circuit breaker as get_ai_response;
+    canned, cached and unavailable replies are yielded as a single chunk.
+    """
+    greeting_match = GREETING_RE.match(user_message)
+    if greeting_match:
+        yield CANNED_RESPONSES[greeting_match.group(1).lower()]
+        return
+
+    if not openai_client:
+        yield "I'm sorry, but AI functionality is currently unavailable. Please ensure the OPENAI_API_KEY is properly configured."
+        return
+
+    cache_key = get_response_cache_key(user_message, conversation_history, places_data)
+    cached_response = get_cached_response(cache_key)
+    if cached_response:
+        yield cached_response
+        return
+
+    # Identical prompts arriving together ride on one upstream call; followers get the leader's finished reply
+    is_leader, inflight_event = join_inflight_request(cache_key)
+    if not is_leader:
+        inflight_event.wait(INFLIGHT_WAIT_TIMEOUT)
+    cached_response = get_cached_response(cache_key)
+    if cached_response:
+        if is_leader:
+            finish_inflight_request(cache_key)
+        yield cached_response
+        return
+
+    try:
+        semantic_vector = None
+        places_fingerprint = get_places_fingerprint(places_data)
+        if SEMANTIC_CACHE_ENABLED:
+            try:
+                semantic_vector = embed_text(get_semantic_cache_text(user_message, conversation_history))
+                cached_response = lookup_semantic_cache(semantic_vector, places_fingerprint)
+            except Exception as e:
+                logger.warning(f"Semantic cache lookup failed: {str(e)}")
+                semantic_vector = None
+            if cached_response:
+                yield cached_response
+                return
+
+        if circuit_is_open():
+            yield CIRCUIT_OPEN_MESSAGE
+            return
+
+        messages = build_chat_messages(user_message, conversation_history, places_data)
+
+        parts = []
+        try:
+            # Closing the stream (also when the browser disconnects mid-reply) returns its connection to the pool
+            with openai_client.chat.completions.create(messages=messages, stream=True, **OPENAI_CHAT_PARAMS) as stream:
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        parts.append(chunk.choices[0].delta.content)
+                        yield chunk.choices[0].delta.content
+        except Exception:
+            record_upstream_failure()
+            raise
+        record_upstream_success()
+
+        # Cache the finished reply so /api/chat and later streams can reuse it
+        content = "".join(parts).strip()
+        store_cached_response(cache_key, content)
+        if semantic_vector is not None:
+            store_semantic_cache(semantic_vector, content, places_fingerprint)
+    finally:
+        if is_leader:
+            finish_inflight_request(cache_key)
+
 @app.route('/')
 def serve_index():
     """Serve the main HTML file from the project root."""
     return send_from_directory(str(BASE_DIR), 'index.html')
 
-@app.route('/<path:filename>')
-def serve_static(filename):
-    """Serve static files from the project root."""
-    return send_from_directory(str(BASE_DIR), filename)
-
 @app.route('/api/chat', methods=['POST'])
 def chat():
     """Handle chat messages with location data integration"""
     try:
-        data = request.json
-        user_message = data.get('message', '').strip()
-        conversation_history = data.get('history', [])
-        
+        try:
+            chat_request = ChatRequest.model_validate_json(request.get_data())
+        except ValidationError as e:
+            return jsonify({'error': 'Invalid request', 'details': e.errors(include_url=False, include_context=False)}), 400
+        user_message = chat_request.message
+        conversation_history = [msg.model_dump() for msg in chat_request.history]
+
         if not user_message:
             return jsonify({'error': 'Message is required'}), 400
         
         # Check if query requires location data vs basic response
         places_data = []
-        is_basic = is_basic_question(user_message)
-        is_location_query = detect_location_query(user_message) and not is_basic
+        location_detected, location = analyze_location_query(user_message)
+        is_location_query = location_detected and not is_basic_question(user_message)
 
         if is_location_query:
             # Generate location-aware data
-            places_data = generate_mock_places_data(user_message)
+            places_data = generate_mock_places_data(user_message, location)
             logger.info(f"Generated {len(places_data)} location-aware places")
         
         # Get AI response with enhanced data
@@ -1271,27 +1745,56 @@ def chat():
         
         # Log for debugging
         request_type = "singular" if detect_singular_request(user_message) else "plural/multi-day"
-        logger.info(f"Chat request: '{user_message}' - Location detected: {detect_location_query(user_message)} - Request type: {request_type} - Places found: {len(places_data)}")
+        logger.info(f"Chat request: '{user_message}' - Location detected: {location_detected} - Request type: {request_type} - Places found: {len(places_data)}")
 
         return jsonify({
             'success': True,
             'response': ai_response,
             'places_found': len(places_data),
             'enhanced_with_location': len(places_data) > 0,
-            'location_detected': detect_location_query(user_message),
+            'location_detected': location_detected,
             'location_aware_results': True,
             'debug_location': None,
             'timestamp': None
         })
         
     except Exception as e:
-        logger.error(f"Error in chat endpoint: {str(e)}")
+        logger.error(f"Error in chat endpoint: {str(e)[:LOG_ERROR_MAX_CHARS]}")
         return jsonify({
             'success': False,
             'error': 'Internal server error',
             'message': 'Sorry, I encountered an error!'
         }), 500
 
+@app.route('/api/chat/stream', methods=['POST'])
+def chat_stream():
+    """Stream chat replies to the browser as server-sent events"""
+    try:
+        chat_request = ChatRequest.model_validate_json(request.get_data())
+    except ValidationError as e:
+        return jsonify({'error': 'Invalid request', 'details': e.errors(include_url=False, include_context=False)}), 400
+    user_message = chat_request.message
+    conversation_history = [msg.model_dump() for msg in chat_request.history]
+
+    if not user_message:
+        return jsonify({'error': 'Message is required'}), 400
+
+    places_data = []
+    location_detected, location = analyze_location_query(user_message)
+    if location_detected and not is_basic_question(user_message):
+        places_data = generate_mock_places_data(user_message, location)
+
+    def generate():
+        try:
+            for chunk in stream_ai_response(user_message, conversation_history, places_data):
+                yield f"data: {app.json.dumps({'delta': chunk})}\n\n"
+            yield f"data: {app.json.dumps({'done': True, 'places_found': len(places_data)})}\n\n"
+        except Exception as e:
+            logger.error(f"Error streaming AI response: {str(e)[:LOG_ERROR_MAX_CHARS]}")
+            yield f"data: {app.json.dumps({'error': 'Internal server error', 'message': 'Sorry, I encountered an error!'})}\n\n"
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint with API status"""
@@ -7,31 +7,169 @@ import requests
 import logging
 import time
 import googlemaps
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse, quote_plus
-import json
+import hashlib
+import orjson
 import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import redis
+except ImportError:
+    redis = None
 
 logger = logging.getLogger(__name__)
 
+# Shared second-level cache for URL checks, geocodes and processed places when REDIS_URL is set,
+# so every gunicorn worker benefits from work any one of them has done
+redis_client = None
+redis_url = os.getenv("REDIS_URL")
+if redis_url and redis:
+    try:
+        redis_client = redis.Redis(connection_pool=redis.BlockingConnectionPool.from_url(redis_url, max_connections=32))
+    except Exception as e:
+        logger.warning(f"Failed to initialize Redis client: {str(e)}")
+
+def fingerprint(*parts) -> str:
+    """
+    Fixed-size blake2b cache key over the given parts
+    Strings are hashed as UTF-8, anything else as sorted-key JSON; parts are NUL-separated
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if isinstance(part, str):
+            digest.update(part.encode('utf-8'))
+        else:
+            digest.update(orjson.dumps(part, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+def shared_cache_get_many(keys: List[str]) -> List:
+    """Fetch JSON values from the shared cache in one round trip; misses (and any failure) are None"""
+    if not redis_client or not keys:
+        return [None] * len(keys)
+    try:
+        return [orjson.loads(value) if value else None for value in redis_client.mget(keys)]
+    except Exception as e:
+        logger.warning(f"Redis cache lookup failed: {str(e)}")
+        return [None] * len(keys)
+
+def shared_cache_get(key: str):
+    """Fetch one JSON value from the shared cache, or None"""
+    return shared_cache_get_many([key])[0]
+
+def shared_cache_set(key: str, ttl: int, value) -> None:
+    """Store a JSON value in the shared cache for ttl seconds"""
+    if not redis_client:
+        return
+    try:
+        redis_client.setex(key, ttl, orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS))
+    except Exception as e:
+        logger.warning(f"Redis cache store failed: {str(e)}")
+
+# Phone cleanup: a C-level translate table for plain ASCII input, the regex for anything else
+PHONE_STRIP_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not (chr(c).isdigit() or chr(c) == '+')))
+PHONE_STRIP_RE = re.compile(r'[^\d+]')
+
 class DataValidator:
     """Comprehensive data validation system for accurate Builder.io implementations"""
+
+    # Upper bound on concurrent URL checks, so a large batch can't exhaust sockets
+    MAX_VALIDATION_WORKERS = 32
+    # Keep-alive pools per host (maps, yelp, tripadvisor, ...) and connections kept per pool;
+    # sized for process_places_bulk running several places' URL checks at once
+    HTTP_POOL_CONNECTIONS = 64
+    HTTP_POOL_MAXSIZE = 128
+    # Reachability results are reused for an hour; the same search links recur on every request
+    URL_CACHE_TTL = 3600
+    URL_CACHE_MAX_ENTRIES = 10000
+    # Geocodes of a fixed address practically never change
+    GEOCODE_CACHE_TTL = 7 * 86400
+    GEOCODE_CACHE_MAX_ENTRIES = 50000
     
     def __init__(self, gmaps_client=None, google_images_api_key=None, google_search_engine_id=None):
         self.gmaps_client = gmaps_client
         self.google_images_api_key = google_images_api_key
         self.google_search_engine_id = google_search_engine_id
         self.session = requests.Session()
+        # Pool sized for concurrent checks so they reuse connections; one quick retry on gateway errors,
+        # after which the final response is returned (and cached) rather than raised
+        adapter = HTTPAdapter(
+            pool_connections=self.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=self.HTTP_POOL_MAXSIZE,
+            max_retries=Retry(total=1, backoff_factor=0.1, status_forcelist=[502, 503, 504], raise_on_status=False)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        self._url_cache = OrderedDict()  # fingerprint of normalized URL -> (result, checked_at)
+        self._url_cache_lock = threading.Lock()
+        self._geocode_cache = OrderedDict()  # fingerprint of normalized address -> ((lat, lng, location_type, formatted_address) or None, fetched_at)
+        self._geocode_cache_lock = threading.Lock()
+        self.trusted_urls = set()  # URLs we ship ourselves (e.g. ImageSourcer fallbacks); never probed over HTTP
+
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """Cache key for a URL: scheme and host are case-insensitive, path and query are kept as-is"""
+        parsed = urlparse(url.strip())
+        return parsed._replace(scheme=parsed.scheme.lower(), netloc=parsed.netloc.lower(), fragment='').geturl()
         
     def validate_url(self, url: str, timeout: int = 10) -> Dict:
         """
         Validate URL returns 200 status code and is accessible
-        Returns validation result with status and metadata
+        Returns validation result with status and metadata; answered results are cached for URL_CACHE_TTL
         """
+        if not url or url == '#' or not url.startswith(('http://', 'https://')):
+            return self._check_url(url, timeout)
+
+        if url in self.trusted_urls:
+            return {
+                'valid': True,
+                'status_code': 200,
+                'final_url': url,
+                'accessible': True,
+                'cached': True
+            }
+
+        cache_key = fingerprint(self._normalize_url(url))
+        with self._url_cache_lock:
+            entry = self._url_cache.get(cache_key)
+            if entry and time.time() - entry[1] < self.URL_CACHE_TTL:
+                self._url_cache.move_to_end(cache_key)
+                return dict(entry[0])
+
+        shared_key = "jf:url:" + cache_key
+        result = shared_cache_get(shared_key)
+        if result is None:
+            result = self._check_url(url, timeout)
+            # Timeouts and connection errors are transient, so only cache URLs that actually answered
+            if result['status_code'] is not None:
+                shared_cache_set(shared_key, self.URL_CACHE_TTL, result)
+
+        if result['status_code'] is not None:
+            with self._url_cache_lock:
+                self._url_cache[cache_key] = (result, time.time())
+                self._url_cache.move_to_end(cache_key)
+                while len(self._url_cache) > self.URL_CACHE_MAX_ENTRIES:
+                    self._url_cache.popitem(last=False)
+        return dict(result)
+
+    def _check_url(self, url: str, timeout: int = 10) -> Dict:
+        """Fetch a URL's status with HEAD, falling back to a limited GET"""
         try:
             if not url or url == '#' or not url.startswith(('http://', 'https://')):
                 return {
@@ -43,11 +181,10 @@ class DataValidator:
             
             response = self.session.head(url, timeout=timeout, allow_redirects=True)
             
-            # If HEAD fails, try GET with limited content
+            # If HEAD fails, retry with a GET; headers are all we need, so don't download the body
             if response.status_code >= 400:
                 response = self.session.get(url, timeout=timeout, stream=True)
-                # Read only first 1KB to check accessibility
-                content = response.raw.read(1024)
+                response.close()
                 
             return {
                 'valid': response.status_code == 200,
@@ -73,6 +210,88 @@ class DataValidator:
                 'accessible': False
             }
     
+    def validate_urls_bulk(self, urls: List[str], timeout: int = 10) -> Dict[str, Dict]:
+        """
+        Validate many URLs concurrently on the shared session
+        Returns a dict mapping each distinct URL to its validate_url result
+        """
+        unique_urls = list(dict.fromkeys(url for url in urls if url))
+        if not unique_urls:
+            return {}
+
+        workers = min(self.MAX_VALIDATION_WORKERS, len(unique_urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(lambda url: self.validate_url(url, timeout), unique_urls)
+            return dict(zip(unique_urls, results))
+    
+    @staticmethod
+    def _normalize_address(address: str) -> str:
+        """Cache key for an address: Unicode-normalized, lowercased, whitespace collapsed"""
+        return " ".join(unicodedata.normalize('NFKC', address).lower().split())
+
+    def geocode_bulk(self, addresses: List[str]) -> Dict[str, Optional[Tuple[float, float, str, str]]]:
+        """
+        Geocode many addresses concurrently, one Maps call per distinct normalized address
+        Warms the geocode cache; addresses whose lookup raised are left out of the result
+        """
+        unique_addresses = {}
+        for address in addresses:
+            if address:
+                unique_addresses.setdefault(self._normalize_address(address), address)
+        if not self.gmaps_client or not unique_addresses:
+            return {}
+
+        def geocode_one(address):
+            try:
+                return address, self._geocode(address), True
+            except Exception as e:
+                logger.warning(f"Geocode prefetch failed for {address}: {str(e)}")
+                return address, None, False
+
+        results = {}
+        workers = min(self.MAX_VALIDATION_WORKERS, len(unique_addresses))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for address, geocoded, ok in executor.map(geocode_one, unique_addresses.values()):
+                if ok:
+                    results[address] = geocoded
+        return results
+    
+    def _geocode(self, address: str) -> Optional[Tuple[float, float, str, str]]:
+        """
+        Geocode an address through the Maps client, caching by normalized address
+        Returns (lat, lng, location_type, formatted_address), or None when Google has no match
+        """
+        cache_key = fingerprint(self._normalize_address(address))
+        with self._geocode_cache_lock:
+            entry = self._geocode_cache.get(cache_key)
+            if entry and time.time() - entry[1] < self.GEOCODE_CACHE_TTL:
+                self._geocode_cache.move_to_end(cache_key)
+                return entry[0]
+
+        # Wrapped in a dict so a cached "no match" (None) is distinguishable from a miss
+        shared = shared_cache_get("jf:geo:" + cache_key)
+        if shared is not None:
+            geocoded = tuple(shared['geocoded']) if shared['geocoded'] else None
+        else:
+            geocode_result = self.gmaps_client.geocode(address)
+            geocoded = None
+            if geocode_result:
+                geometry = geocode_result[0]['geometry']
+                geocoded = (
+                    geometry['location']['lat'],
+                    geometry['location']['lng'],
+                    geometry.get('location_type', 'UNKNOWN'),
+                    geocode_result[0]['formatted_address']
+                )
+            shared_cache_set("jf:geo:" + cache_key, self.GEOCODE_CACHE_TTL, {'geocoded': geocoded})
+
+        with self._geocode_cache_lock:
+            self._geocode_cache[cache_key] = (geocoded, time.time())
+            self._geocode_cache.move_to_end(cache_key)
+            while len(self._geocode_cache) > self.GEOCODE_CACHE_MAX_ENTRIES:
+                self._geocode_cache.popitem(last=False)
+        return geocoded
+    
     def validate_coordinates_match_address(self, address: str, lat: float, lng: float, tolerance_km: float = 1.0) -> Dict:
         """
         Verify geographic coordinates match the provided address
@@ -87,18 +306,16 @@ class DataValidator:
         
         try:
             # Geocode the address to get coordinates
-            geocode_result = self.gmaps_client.geocode(address)
+            geocoded = self._geocode(address)
             
-            if not geocode_result:
+            if not geocoded:
                 return {
                     'valid': False,
                     'error': 'Address could not be geocoded',
                     'distance_km': None
                 }
             
-            geocoded_location = geocode_result[0]['geometry']['location']
-            geocoded_lat = geocoded_location['lat']
-            geocoded_lng = geocoded_location['lng']
+            geocoded_lat, geocoded_lng, location_type, formatted_address = geocoded
             
             # Calculate distance using haversine formula
             distance_km = self._calculate_distance(lat, lng, geocoded_lat, geocoded_lng)
@@ -114,8 +331,8 @@ class DataValidator:
                     'lat': lat,
                     'lng': lng
                 },
-                'accuracy': geocode_result[0]['geometry'].get('location_type', 'UNKNOWN'),
-                'formatted_address': geocode_result[0]['formatted_address']
+                'accuracy': location_type,
+                'formatted_address': formatted_address
             }
             
         except Exception as e:
@@ -146,6 +363,18 @@ class DataValidator:
         
         return R * c
     
+    def calculate_distances_bulk(self, lat1: List[float], lng1: List[float], lat2: List[float], lng2: List[float]) -> List[float]:
+        """
+        Haversine distances in km for many coordinate pairs at once
+        Vectorized with NumPy when it is installed, otherwise computed pair by pair
+        """
+        if np is None:
+            return [self._calculate_distance(*pair) for pair in zip(lat1, lng1, lat2, lng2)]
+
+        lat1_rad, lng1_rad, lat2_rad, lng2_rad = (np.radians(np.asarray(values, dtype=float)) for values in (lat1, lng1, lat2, lng2))
+        a = np.sin((lat2_rad - lat1_rad) / 2) ** 2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin((lng2_rad - lng1_rad) / 2) ** 2
+        return (6371 * 2 * np.arcsin(np.sqrt(a))).tolist()
+    
     def validate_contact_info(self, phone: str = None, website: str = None, place_name: str = None) -> Dict:
         """
         Validate contact information through multiple sources
@@ -190,7 +419,10 @@ class DataValidator:
             return {'valid': False, 'error': 'No phone number provided'}
         
         # Remove all non-digit characters except + at the beginning
-        clean_phone = re.sub(r'[^\d+]', '', phone)
+        if phone.isascii():
+            clean_phone = phone.translate(PHONE_STRIP_TABLE)
+        else:
+            clean_phone = PHONE_STRIP_RE.sub('', phone)
         
         # Basic international format validation
         if clean_phone.startswith('+'):
@@ -200,7 +432,7 @@ class DataValidator:
                 return {'valid': False, 'error': 'Invalid international format length'}
         else:
             # Assume US format if no country code
-            digits_only = re.sub(r'[^\d]', '', phone)
+            digits_only = clean_phone.replace('+', '')
             if len(digits_only) == 10:
                 return {'valid': True, 'formatted': f"+1{digits_only}"}
             elif len(digits_only) == 11 and digits_only.startswith('1'):
@@ -210,11 +442,26 @@ class DataValidator:
 
 class ImageSourcer:
     """Advanced image sourcing system with licensing compliance"""
+
+    # (keyword, fallback category) in priority order; a place type matches if it contains the keyword
+    TYPE_CATEGORY_KEYWORDS = (
+        ('restaurant', 'restaurant'), ('food', 'restaurant'), ('meal_takeaway', 'restaurant'),
+        ('bar', 'bar'), ('night_club', 'bar'),
+        ('cafe', 'cafe'),
+        ('lodging', 'hotel'), ('hotel', 'hotel'),
+        ('place_of_worship', 'temple'), ('temple', 'temple'), ('shrine', 'temple'),
+        ('tourist_attraction', 'tourist_attraction'),
+        ('museum', 'museum'),
+        ('park', 'park'),
+        ('shopping', 'shopping'), ('store', 'shopping'),
+    )
     
-    def __init__(self, google_images_api_key=None, google_search_engine_id=None):
+    def __init__(self, google_images_api_key=None, google_search_engine_id=None, validator=None):
         self.google_images_api_key = google_images_api_key
         self.google_search_engine_id = google_search_engine_id
-        self.session = requests.Session()
+        # Share the validator (and its pooled session and URL cache) instead of opening new connections per image
+        self.validator = validator or DataValidator()
+        self.session = self.validator.session
         
         # Fallback image sources with proper licensing - high quality versions
         self.fallback_images = {
@@ -243,6 +490,32 @@ class ImageSourcer:
             'tokyo temple': 'https://images.pexels.com/photos/4331617/pexels-photo-4331617.jpeg?auto=compress&cs=tinysrgb&w=1200',
             'kyoto temple': 'https://images.pexels.com/photos/4022092/pexels-photo-4022092.jpeg?auto=compress&cs=tinysrgb&w=1200'
         }
+
+        # Category results are fixed once the image table is known, so build them here rather than per place
+        self._category_results = {
+            category: {
+                'success': True,
+                'url': image_url,
+                'source': 'pexels_licensed',
+                'license': 'pexels_license',
+                'confidence': 0.7,  # Increased confidence for better categorization
+                'alt_text': f'{category.title()} image',
+                'attribution': 'Pexels'
+            }
+            for category, image_url in self.fallback_images.items()
+        }
+        # One pass over the place name finds any famous landmark (longest name wins on overlap)
+        self._specific_place_re = re.compile("|".join(
+            map(re.escape, sorted(self.specific_place_images, key=len, reverse=True))
+        ))
+
+        # Place type -> (priority rank, category); exact types are seeded up front, others are memoized on first sight
+        self._type_to_category = {}
+        for rank, (keyword, category) in enumerate(self.TYPE_CATEGORY_KEYWORDS):
+            self._type_to_category.setdefault(keyword, (rank, category))
+
+        # Our static Pexels fallbacks are known-good, so validating them shouldn't cost a HEAD request
+        self.validator.trusted_urls.update(self.fallback_images.values(), self.specific_place_images.values())
     
     def get_primary_image(self, place_name: str, place_types: List[str], location: str = None) -> Dict:
         """
@@ -285,11 +558,12 @@ class ImageSourcer:
                 search_query += f" {location}"
             
             # Add context based on place type
-            if 'restaurant' in str(place_types).lower():
+            place_types_lower = [str(place_type).lower() for place_type in place_types or []]
+            if any('restaurant' in place_type for place_type in place_types_lower):
                 search_query += " restaurant interior exterior"
-            elif 'lodging' in str(place_types).lower():
+            elif any('lodging' in place_type for place_type in place_types_lower):
                 search_query += " hotel building"
-            elif 'tourist_attraction' in str(place_types).lower():
+            elif any('tourist_attraction' in place_type for place_type in place_types_lower):
                 search_query += " attraction landmark"
             
             url = "https://www.googleapis.com/customsearch/v1"
@@ -301,13 +575,15 @@ class ImageSourcer:
                 'rights': 'cc_publicdomain,cc_attribute,cc_sharealike',  # Licensed images only
                 'num': 5,
                 'safe': 'active',
-                'imgSize': 'large'
+                'imgSize': 'large',
+                # Only the fields we read below; skips thumbnails and pagemap metadata on the wire
+                'fields': 'items(link,title,displayLink,image/width,image/height)'
             }
             
             response = self.session.get(url, params=params, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 items = data.get('items', [])
                 
                 if items:
@@ -316,8 +592,7 @@ class ImageSourcer:
                     image_url = image_item.get('link')
                     
                     # Validate image is accessible
-                    validator = DataValidator()
-                    url_validation = validator.validate_url(image_url)
+                    url_validation = self.validator.validate_url(image_url)
                     
                     if url_validation['valid']:
                         return {
@@ -354,79 +629,107 @@ class ImageSourcer:
             logger.error(f"Web licensed image search failed: {str(e)}")
             return {'success': False, 'error': f'Web search error: {str(e)}'}
     
+    def _categorize_type(self, place_type: str) -> Tuple[int, str]:
+        """Map one place type to its (priority rank, fallback category)"""
+        hit = self._type_to_category.get(place_type)
+        if hit is None:
+            place_type_lower = str(place_type).lower()
+            hit = next(
+                ((rank, category) for rank, (keyword, category) in enumerate(self.TYPE_CATEGORY_KEYWORDS) if keyword in place_type_lower),
+                (len(self.TYPE_CATEGORY_KEYWORDS), 'default')
+            )
+            self._type_to_category[place_type] = hit
+        return hit
+    
     def _get_fallback_image(self, place_types: List[str], place_name: str = "") -> Dict:
         """Get appropriate fallback image based on place type with enhanced categorization"""
-        place_types_str = str(place_types).lower()
-        place_name_lower = place_name.lower()
-
         # First check for specific famous places
-        for specific_place, image_url in self.specific_place_images.items():
-            if specific_place in place_name_lower:
-                return {
-                    'success': True,
-                    'url': image_url,
-                    'source': 'pexels_specific',
-                    'license': 'pexels_license',
-                    'confidence': 0.9,  # High confidence for specific places
-                    'alt_text': f'{place_name} - {specific_place}',
-                    'attribution': 'Pexels'
-                }
+        match = self._specific_place_re.search(place_name.lower())
+        if match:
+            specific_place = match.group(0)
+            return {
+                'success': True,
+                'url': self.specific_place_images[specific_place],
+                'source': 'pexels_specific',
+                'license': 'pexels_license',
+                'confidence': 0.9,  # High confidence for specific places
+                'alt_text': f'{place_name} - {specific_place}',
+                'attribution': 'Pexels'
+            }
 
-        # Then categorize by place type
-        if 'restaurant' in place_types_str or 'food' in place_types_str or 'meal_takeaway' in place_types_str:
-            image_url = self.fallback_images['restaurant']
-            category = 'restaurant'
-        elif 'bar' in place_types_str or 'night_club' in place_types_str:
-            image_url = self.fallback_images['bar']
-            category = 'bar'
-        elif 'cafe' in place_types_str:
-            image_url = self.fallback_images['cafe']
-            category = 'cafe'
-        elif 'lodging' in place_types_str or 'hotel' in place_types_str:
-            image_url = self.fallback_images['hotel']
-            category = 'hotel'
-        elif 'place_of_worship' in place_types_str or 'temple' in place_types_str or 'shrine' in place_types_str:
-            image_url = self.fallback_images['temple']
-            category = 'temple'
-        elif 'tourist_attraction' in place_types_str:
-            image_url = self.fallback_images['tourist_attraction']
-            category = 'tourist_attraction'
-        elif 'museum' in place_types_str:
-            image_url = self.fallback_images['museum']
-            category = 'museum'
-        elif 'park' in place_types_str:
-            image_url = self.fallback_images['park']
-            category = 'park'
-        elif 'shopping' in place_types_str or 'store' in place_types_str:
-            image_url = self.fallback_images['shopping']
-            category = 'shopping'
-        else:
-            image_url = self.fallback_images['default']
-            category = 'default'
-
-        return {
-            'success': True,
-            'url': image_url,
-            'source': 'pexels_licensed',
-            'license': 'pexels_license',
-            'confidence': 0.7,  # Increased confidence for better categorization
-            'alt_text': f'{category.title()} image',
-            'attribution': 'Pexels'
-        }
+        # Then categorize by place type: the highest-priority category any type falls into wins
+        category = 'default'
+        best_rank = len(self.TYPE_CATEGORY_KEYWORDS)
+        for place_type in place_types or []:
+            rank, type_category = self._categorize_type(place_type)
+            if rank < best_rank:
+                best_rank, category = rank, type_category
+
+        return dict(self._category_results[category])
 
 class ComprehensiveDataProcessor:
     """Main processor for comprehensive data accuracy and validation"""
+
+    # Place fields holding links we verify
+    URL_KEYS = (
+        'google_maps_url', 'yelp_search_url', 'tripadvisor_search_url',
+        'website', 'opentable_url', 'booking_url', 'uber_url'
+    )
+    MAX_PLACE_WORKERS = 16
+    # Enhanced results depend only on the input place, but they embed URL checks, so they must not outlive those
+    PLACE_CACHE_TTL = DataValidator.URL_CACHE_TTL
+    # Shared entries carry their processing time, so a copy pulled from Redis keeps its original age
+    PLACE_CACHE_PREFIX = "jf:place:"
+    PLACE_CACHE_MAX_ENTRIES = 5000
     
     def __init__(self, gmaps_client=None, google_images_api_key=None, google_search_engine_id=None):
         self.validator = DataValidator(gmaps_client, google_images_api_key, google_search_engine_id)
-        self.image_sourcer = ImageSourcer(google_images_api_key, google_search_engine_id)
+        self.image_sourcer = ImageSourcer(google_images_api_key, google_search_engine_id, self.validator)
         self.gmaps_client = gmaps_client
+        self._place_cache = OrderedDict()  # input hash -> (enhanced_place, processed_at)
+        self._place_cache_lock = threading.Lock()
+
+    @staticmethod
+    def _place_cache_key(place_data: Dict) -> str:
+        """Stable hash of a place's input fields, ignoring our own underscore-prefixed metadata"""
+        return fingerprint({key: value for key, value in place_data.items() if not str(key).startswith('_')})
     
     def process_place_data(self, place_data: Dict) -> Dict:
         """
         Process place data with comprehensive validation and enhancement
         Returns enhanced place data with validation scores and accurate images
         """
+        cache_key = self._place_cache_key(place_data)
+        with self._place_cache_lock:
+            entry = self._place_cache.get(cache_key)
+            if entry and time.time() - entry[1] < self.PLACE_CACHE_TTL:
+                self._place_cache.move_to_end(cache_key)
+                return entry[0].copy()
+
+        shared = shared_cache_get(self.PLACE_CACHE_PREFIX + cache_key)
+        if shared is not None and self._remember_place(cache_key, shared['place'], shared['processed_at']):
+            return shared['place'].copy()
+
+        enhanced_place = self._enhance_place(place_data)
+        processed_at = time.time()
+        shared_cache_set(self.PLACE_CACHE_PREFIX + cache_key, self.PLACE_CACHE_TTL,
+                         {'place': enhanced_place, 'processed_at': processed_at})
+        self._remember_place(cache_key, enhanced_place, processed_at)
+        return enhanced_place.copy()
+
+    def _remember_place(self, cache_key: str, enhanced_place: Dict, processed_at: float) -> bool:
+        """Store an enhanced place in the in-process cache; returns False if it is already past PLACE_CACHE_TTL"""
+        if time.time() - processed_at >= self.PLACE_CACHE_TTL:
+            return False
+        with self._place_cache_lock:
+            self._place_cache[cache_key] = (enhanced_place, processed_at)
+            self._place_cache.move_to_end(cache_key)
+            while len(self._place_cache) > self.PLACE_CACHE_MAX_ENTRIES:
+                self._place_cache.popitem(last=False)
+        return True
+
+    def _enhance_place(self, place_data: Dict) -> Dict:
+        """Run every validation and image-sourcing step for one place"""
         enhanced_place = place_data.copy()
         
         # Initialize validation tracking
@@ -440,27 +743,25 @@ class ComprehensiveDataProcessor:
         }
         
         # 1. Validate all URLs
-        urls_to_check = [
-            'google_maps_url', 'yelp_search_url', 'tripadvisor_search_url',
-            'website', 'opentable_url', 'booking_url', 'uber_url'
-        ]
-        
         valid_urls = 0
         total_urls = 0
-        
-        for url_key in urls_to_check:
-            if url_key in enhanced_place and enhanced_place[url_key]:
-                total_urls += 1
-                url_validation = self.validator.validate_url(enhanced_place[url_key])
-                validation_results['url_validations'][url_key] = url_validation
-                
-                if not url_validation['valid']:
-                    # Mark invalid URLs for removal or fixing
-                    enhanced_place[f'{url_key}_status'] = 'invalid'
-                    logger.warning(f"Invalid URL for {enhanced_place.get('name', 'Unknown')}: {url_key}")
-                else:
-                    valid_urls += 1
-                    enhanced_place[f'{url_key}_status'] = 'valid'
+
+        # Check every URL at once rather than one round trip after another
+        present_keys = [url_key for url_key in self.URL_KEYS if enhanced_place.get(url_key)]
+        bulk_results = self.validator.validate_urls_bulk([enhanced_place[url_key] for url_key in present_keys])
+        
+        for url_key in present_keys:
+            total_urls += 1
+            url_validation = bulk_results[enhanced_place[url_key]]
+            validation_results['url_validations'][url_key] = url_validation
+            
+            if not url_validation['valid']:
+                # Mark invalid URLs for removal or fixing
+                enhanced_place[f'{url_key}_status'] = 'invalid'
+                logger.warning(f"Invalid URL for {enhanced_place.get('name', 'Unknown')}: {url_key}")
+            else:
+                valid_urls += 1
+                enhanced_place[f'{url_key}_status'] = 'valid'
         
         # 2. Validate coordinates match address
         if 'address' in enhanced_place and 'geometry' in place_data:
@@ -527,6 +828,26 @@ class ComprehensiveDataProcessor:
         
         return enhanced_place
     
+    def process_places_bulk(self, places: List[Dict]) -> List[Dict]:
+        """
+        Process many places concurrently, preserving input order
+        Each place is independent and network-bound, so wall time tracks the slowest place
+        """
+        if not places:
+            return []
+
+        # One MGET warms the local cache with every place another worker has already processed
+        cache_keys = [self._place_cache_key(place) for place in places]
+        for cache_key, shared in zip(cache_keys, shared_cache_get_many([self.PLACE_CACHE_PREFIX + key for key in cache_keys])):
+            if shared is not None:
+                self._remember_place(cache_key, shared['place'], shared['processed_at'])
+
+        # Resolve every distinct address up front so places sharing one don't race to geocode it
+        self.validator.geocode_bulk([place['address'] for place in places if place.get('address') and 'geometry' in place])
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_PLACE_WORKERS, len(places))) as executor:
+            return list(executor.map(self.process_place_data, places))
+    
     def filter_high_confidence_places(self, places: List[Dict], min_confidence: float = 0.7) -> List[Dict]:
         """Filter places by data quality score to ensure high-confidence results"""
         high_confidence_places = []
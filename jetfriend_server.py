@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
+import http.client
 import http.server
 import socketserver
-import json
 import urllib.parse
 import os
-import urllib.request
+import gzip
+import functools
+import queue
+import time
 from datetime import datetime
 
+from json_helpers import dumps_json, loads_json
+
 # Load environment variables
 def load_env():
     env_vars = {}
@@ -25,17 +30,8 @@ def load_env():
 # Load .env file
 load_env()
 
-def get_ai_response(user_message, conversation_history=None):
-    """
-    Send a message to Google Gemini and get a response
-    """
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        return "I'm sorry, but AI functionality is currently unavailable. Please set the GEMINI_API_KEY environment variable to enable AI responses."
-
-    try:
-        # Create the prompt with system context
-        full_prompt = """You are JetFriend, an intelligent AI travel companion. Follow these guidelines:
+# JetFriend persona, built once at import and prepended to every Gemini prompt
+SYSTEM_PROMPT = """You are JetFriend, an intelligent AI travel companion. Follow these guidelines:
 
 PERSONALITY & TONE:
 - Be friendly, enthusiastic, and knowledgeable about travel
@@ -75,58 +71,163 @@ I can suggest the best neighborhoods to stay in and must-see spots based on your
 
 """
 
-        # Add conversation history if provided
-        if conversation_history:
-            for msg in conversation_history:
-                role = "Human" if msg.get("role") == "user" else "Assistant"
-                full_prompt += f"{role}: {msg.get('content', '')}\n"
-
-        # Add current user message
-        full_prompt += f"Human: {user_message}\nAssistant:"
-
-        # Prepare the request payload for Gemini
-        payload = {
-            "contents": [
-                {
-                    "parts": [
-                        {
-                            "text": full_prompt
-                        }
-                    ]
-                }
-            ]
-        }
-
-        # Make the API request
-        url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
-        headers = {
-            'Content-Type': 'application/json',
-            'X-goog-api-key': api_key
-        }
-
-        # Create request
-        req = urllib.request.Request(
-            url, 
-            data=json.dumps(payload).encode('utf-8'),
-            headers=headers,
-            method='POST'
-        )
-
-        # Send request
-        with urllib.request.urlopen(req) as response:
-            if response.status == 200:
-                data = json.loads(response.read().decode())
-                if 'candidates' in data and len(data['candidates']) > 0:
-                    content = data['candidates'][0]['content']['parts'][0]['text']
-                    return content.strip()
-                else:
-                    return "I'm sorry, I didn't receive a proper response. Please try again."
-            else:
-                return f"I'm sorry, I'm having trouble connecting right now. Please try again in a moment. Error: {response.status}"
+GEMINI_HOST = "generativelanguage.googleapis.com"
+GEMINI_PATH = "/v1beta/models/gemini-2.0-flash:generateContent"
+GEMINI_STREAM_PATH = "/v1beta/models/gemini-2.0-flash:streamGenerateContent?alt=sse"
+# Static request headers; each call only adds its API key
+GEMINI_HEADERS = {'Content-Type': 'application/json', 'Accept-Encoding': 'gzip'}
+GEMINI_STREAM_HEADERS = {'Content-Type': 'application/json'}
+
+GEMINI_POOL_SIZE = 4  # idle keep-alive connections kept between requests
+
+# Idle keep-alive HTTPS connections to Gemini, reused across chats so each call skips the TCP + TLS handshake
+_gemini_pool = queue.LifoQueue(maxsize=GEMINI_POOL_SIZE)
+
+def open_gemini_request(path, body, headers):
+    """POST to Gemini on a pooled connection; returns (connection, unread response)"""
+    try:
+        conn, reused = _gemini_pool.get_nowait(), True
+    except queue.Empty:
+        conn, reused = http.client.HTTPSConnection(GEMINI_HOST, timeout=60), False
+    try:
+        conn.request('POST', path, body=body, headers=headers)
+        return conn, conn.getresponse()
+    except (http.client.HTTPException, OSError):
+        conn.close()
+        # Gemini may have closed an idle pooled connection; retry once on a fresh one
+        if reused:
+            return open_gemini_request(path, body, headers)
+        raise
+
+def release_gemini_connection(conn, response):
+    """Pool a connection whose response was fully read; close one with unread bytes left on it"""
+    if response.isclosed():
+        try:
+            _gemini_pool.put_nowait(conn)
+            return
+        except queue.Full:
+            pass
+    conn.close()
+
+# Only the most recent turns are sent upstream, within a character budget
+MAX_HISTORY_TURNS = 12
+MAX_HISTORY_CHARS = 8000
+
+def build_prompt(user_message, conversation_history=None):
+    """
+    Build the full Gemini prompt: system context, recent conversation history and the new message
+    """
+    # Create the prompt with system context
+    prompt_parts = [SYSTEM_PROMPT]
+
+    # Add the most recent conversation history, dropping the oldest turns once over budget
+    if conversation_history:
+        history_lines = [
+            f"{'Human' if msg.get('role') == 'user' else 'Assistant'}: {msg.get('content', '')}\n"
+            for msg in conversation_history[-MAX_HISTORY_TURNS:]
+        ]
+        history_chars = sum(map(len, history_lines))
+        while history_lines and history_chars > MAX_HISTORY_CHARS:
+            history_chars -= len(history_lines.pop(0))
+        prompt_parts.extend(history_lines)
+
+    # Add current user message
+    prompt_parts.append(f"Human: {user_message}\nAssistant:")
+    return "".join(prompt_parts)
+
+def request_ai_response(user_message, conversation_history=None):
+    """
+    Call Google Gemini and return the reply text, raising on any failure
+    """
+    full_prompt = build_prompt(user_message, conversation_history)
+
+    # Prepare the request payload for Gemini
+    payload = {"contents": [{"parts": [{"text": full_prompt}]}]}
+
+    # Make the API request; the key travels in a header so it never appears in URLs or logs
+    headers = {**GEMINI_HEADERS, 'X-goog-api-key': os.getenv("GEMINI_API_KEY")}
+
+    # Send request
+    conn, response = open_gemini_request(GEMINI_PATH, dumps_json(payload), headers)
+    try:
+        body = response.read()
+    finally:
+        release_gemini_connection(conn, response)
+    if response.status != 200:
+        raise ValueError(f"Gemini returned HTTP {response.status}")
+    # http.client doesn't decode transfer compression itself
+    if response.headers.get('Content-Encoding') == 'gzip':
+        body = gzip.decompress(body)
+    data = loads_json(body)
+    if not data.get('candidates'):
+        raise ValueError("Gemini returned no candidates")
+    return data['candidates'][0]['content']['parts'][0]['text'].strip()
+
+# History-free prompts (opening greetings, repeat questions) repeat verbatim; failures raise and are never cached
+@functools.lru_cache(maxsize=256)
+def cached_ai_response(user_message):
+    return request_ai_response(user_message)
+
+def get_ai_response(user_message, conversation_history=None, use_cache=True):
+    """
+    Send a message to Google Gemini and get a response
+    """
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        return "I'm sorry, but AI functionality is currently unavailable. Please set the GEMINI_API_KEY environment variable to enable AI responses."
+
+    try:
+        if use_cache and not conversation_history:
+            return cached_ai_response(user_message)
+        return request_ai_response(user_message, conversation_history)
 
     except Exception as e:
         return f"I'm sorry, I'm having trouble connecting right now. Please try again in a moment. Error: {str(e)}"
 
+# /api/test re-probes Gemini at most once a minute, so dashboard polling doesn't hammer the API
+TEST_PROBE_TTL = 60  # seconds
+TEST_PROBE_MESSAGE = "Hello! Can you tell me you're working correctly as JetFriend?"
+_test_probe = (None, None)  # (monotonic time of probe, reply)
+
+def probe_ai():
+    """Return a recent /api/test probe reply, asking Gemini again once the last one is older than TEST_PROBE_TTL"""
+    global _test_probe
+    probed_at, reply = _test_probe
+    if probed_at is None or time.monotonic() - probed_at >= TEST_PROBE_TTL:
+        reply = get_ai_response(TEST_PROBE_MESSAGE, use_cache=False)
+        _test_probe = (time.monotonic(), reply)
+    return reply
+
+def stream_ai_response(user_message, conversation_history=None):
+    """
+    Stream a Gemini response, yielding text chunks as Gemini produces them
+    """
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        yield "I'm sorry, but AI functionality is currently unavailable. Please set the GEMINI_API_KEY environment variable to enable AI responses."
+        return
+
+    payload = {"contents": [{"parts": [{"text": build_prompt(user_message, conversation_history)}]}]}
+    headers = {**GEMINI_STREAM_HEADERS, 'X-goog-api-key': api_key}
+    conn, response = open_gemini_request(GEMINI_STREAM_PATH, dumps_json(payload), headers)
+    try:
+        if response.status != 200:
+            response.read()
+            raise ValueError(f"Gemini returned HTTP {response.status}")
+        # Gemini sends one "data: {...}" server-sent event per generated chunk
+        for line in response:
+            if not line.startswith(b'data:'):
+                continue
+            data = loads_json(line[5:])
+            for candidate in data.get('candidates', [])[:1]:
+                for part in candidate.get('content', {}).get('parts', []):
+                    if part.get('text'):
+                        yield part['text']
+        response.read()
+    finally:
+        # An abandoned stream still has unread bytes, so its connection is closed rather than pooled
+        release_gemini_connection(conn, response)
+
 class JetFriendHandler(http.server.SimpleHTTPRequestHandler):
     def do_GET(self):
         if self.path == "/":
@@ -145,7 +246,7 @@ class JetFriendHandler(http.server.SimpleHTTPRequestHandler):
                     'travel_chat': True
                 }
             }
-            self.wfile.write(json.dumps(response).encode())
+            self.wfile.write(dumps_json(response))
             return
         elif self.path == "/api/test":
             api_key = os.getenv("GEMINI_API_KEY")
@@ -160,11 +261,11 @@ class JetFriendHandler(http.server.SimpleHTTPRequestHandler):
                     'ai_status': 'disconnected',
                     'message': 'Please set the GEMINI_API_KEY environment variable to enable AI functionality.'
                 }
-                self.wfile.write(json.dumps(response).encode())
+                self.wfile.write(dumps_json(response))
                 return
             
             try:
-                test_response = get_ai_response("Hello! Can you tell me you're working correctly as JetFriend?")
+                test_response = probe_ai()
                 self.send_response(200)
                 self.send_header('Content-Type', 'application/json')
                 self.send_header('Access-Control-Allow-Origin', '*')
@@ -174,7 +275,7 @@ class JetFriendHandler(http.server.SimpleHTTPRequestHandler):
                     'test_response': test_response,
                     'ai_status': 'connected'
                 }
-                self.wfile.write(json.dumps(response).encode())
+                self.wfile.write(dumps_json(response))
                 return
             except Exception as e:
                 self.send_response(500)
@@ -186,7 +287,7 @@ class JetFriendHandler(http.server.SimpleHTTPRequestHandler):
                     'error': str(e),
                     'ai_status': 'disconnected'
                 }
-                self.wfile.write(json.dumps(response).encode())
+                self.wfile.write(dumps_json(response))
                 return
         
         return super().do_GET()
@@ -202,13 +303,13 @@ class JetFriendHandler(http.server.SimpleHTTPRequestHandler):
             self.end_headers()
             
             try:
-                data = json.loads(post_data.decode())
+                data = loads_json(post_data)
                 user_message = data.get('message', '').strip()
                 conversation_history = data.get('history', [])
                 
                 if not user_message:
                     response = {'error': 'Message is required'}
-                    self.wfile.write(json.dumps(response).encode())
+                    self.wfile.write(dumps_json(response))
                     return
                 
                 # Get AI response using Gemini API
@@ -227,7 +328,45 @@ class JetFriendHandler(http.server.SimpleHTTPRequestHandler):
                     'message': 'Sorry, I encountered an error processing your request.'
                 }
             
-            self.wfile.write(json.dumps(response).encode())
+            self.wfile.write(dumps_json(response))
+            return
+
+        if self.path == "/api/chat/stream":
+            content_length = int(self.headers['Content-Length'])
+            post_data = self.rfile.read(content_length)
+
+            try:
+                data = loads_json(post_data)
+                user_message = data.get('message', '').strip()
+                conversation_history = data.get('history', [])
+            except Exception:
+                user_message = ''
+
+            if not user_message:
+                self.send_response(400)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+                self.wfile.write(dumps_json({'error': 'Message is required'}))
+                return
+
+            # Forward each Gemini chunk to the browser as a server-sent event
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+
+            try:
+                for chunk in stream_ai_response(user_message, conversation_history):
+                    self.wfile.write(b'data: ' + dumps_json({'delta': chunk}) + b'\n\n')
+                    self.wfile.flush()
+                self.wfile.write(b'data: ' + dumps_json({'done': True, 'timestamp': datetime.now().isoformat()}) + b'\n\n')
+            except Exception as e:
+                self.wfile.write(b'data: ' + dumps_json({
+                    'error': 'Internal server error',
+                    'message': "I'm sorry, I'm having trouble connecting right now. Please try again in a moment."
+                }) + b'\n\n')
             return
         
         self.send_response(405)
@@ -259,6 +398,7 @@ if __name__ == "__main__":
             print("   • GET  /api/health - Health check")
             print("   • GET  /api/test   - AI connectivity test") 
             print("   • POST /api/chat   - Chat with JetFriend")
+            print("   • POST /api/chat/stream - Chat with JetFriend (server-sent events)")
             httpd.serve_forever()
     except Exception as e:
         print(f"❌ Error starting server: {e}")
@@ -0,0 +1,22 @@
+"""
+JSON helpers shared by the standalone stdlib servers.
+
+orjson is used when it is installed; otherwise these fall back to the standard
+library, so the servers still run with no third-party packages.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(obj):
+    """Serialize to UTF-8 JSON bytes"""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+loads_json = orjson.loads if orjson else json.loads
@@ -1,9 +1,17 @@
 #!/usr/bin/env python3
 import http.server
 import socketserver
-import json
 import os
 
+from json_helpers import dumps_json
+
+# The health payload never changes, so serialize it once
+HEALTH_BODY = dumps_json({
+    'status': 'healthy',
+    'service': 'JetFriend Minimal Server',
+    'version': '1.0.0'
+})
+
 class MinimalHandler(http.server.SimpleHTTPRequestHandler):
     def do_GET(self):
         if self.path == "/":
@@ -12,22 +20,24 @@ class MinimalHandler(http.server.SimpleHTTPRequestHandler):
             self.send_response(200)
             self.send_header('Content-Type', 'application/json')
             self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Content-Length', str(len(HEALTH_BODY)))
             self.end_headers()
-            response = {
-                'status': 'healthy',
-                'service': 'JetFriend Minimal Server',
-                'version': '1.0.0'
-            }
-            self.wfile.write(json.dumps(response).encode())
+            self.wfile.write(HEALTH_BODY)
             return
         return super().do_GET()
 
+    def copyfile(self, source, outputfile):
+        # Let the kernel copy static files straight to the socket (falls back to send() for non-file sources)
+        self.connection.sendfile(source)
+
 if __name__ == "__main__":
     PORT = 5002
     print(f"���� Starting minimal server on port {PORT}")
     
-    class ReusableTCPServer(socketserver.TCPServer):
+    # One thread per connection so a slow download doesn't hold up health checks
+    class ReusableTCPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
         allow_reuse_address = True
+        daemon_threads = True
     
     try:
         with ReusableTCPServer(("", PORT), MinimalHandler) as httpd:
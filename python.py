@@ -1,23 +1,36 @@
 import os
+import httpx
 from openai import OpenAI
 
+# Shared HTTP/2 connection pool so back-to-back questions reuse one TLS session to OpenRouter
+http_client = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+    timeout=60.0
+)
+
 # Initialize the OpenAI client with OpenRouter
 client = OpenAI(
     base_url="https://openrouter.ai/api/v1",
     api_key=os.getenv("OPENROUTER_API_KEY"),  # Securely stored API key
+    http_client=http_client,
+    max_retries=2,
 )
 
+EXTRA_HEADERS = {
+    "HTTP-Referer": "https://stevenggg23.github.io/Jet-Friend/",
+    "X-Title": "Jet Friend",
+}
+MODEL = "microsoft/mai-ds-r1:free"
+
 def get_ai_response(user_message):
     """
     Send a message to Microsoft MAI DS R1 and get a response
     """
     try:
         completion = client.chat.completions.create(
-            extra_headers={
-                "HTTP-Referer": "https://stevenggg23.github.io/Jet-Friend/",
-                "X-Title": "Jet Friend",
-            },
-            model="microsoft/mai-ds-r1:free",
+            extra_headers=EXTRA_HEADERS,
+            model=MODEL,
             messages=[
                 {
                     "role": "user",
@@ -29,7 +42,30 @@ def get_ai_response(user_message):
     except Exception as e:
         return f"Error: {str(e)}"
 
+def stream_ai_response(user_message):
+    """
+    Send a message to Microsoft MAI DS R1 and yield the response text as it arrives
+    """
+    try:
+        stream = client.chat.completions.create(
+            extra_headers=EXTRA_HEADERS,
+            model=MODEL,
+            messages=[
+                {
+                    "role": "user",
+                    "content": user_message
+                }
+            ],
+            stream=True
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    except Exception as e:
+        yield f"Error: {str(e)}"
+
 # Example usage
 if __name__ == "__main__":
-    response = get_ai_response("Hello! Tell me about yourself.")
-    print(response)
+    for text in stream_ai_response("Hello! Tell me about yourself."):
+        print(text, end="", flush=True)
+    print()
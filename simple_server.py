@@ -1,41 +1,95 @@
 #!/usr/bin/env python3
+import errno
+import functools
+import http.client
 import http.server
 import socketserver
-import json
+import re
+import signal
+import socket
+import sys
 import urllib.parse
 import os
-import urllib.request
-from datetime import datetime
+import queue
+import time
+
+from json_helpers import dumps_json, loads_json
+
+# KEY=value lines of a .env file; blank lines and # comments never match
+ENV_LINE_RE = re.compile(r'^[ \t]*([^#\s=][^=\n]*)=(.*?)\s*$', re.MULTILINE)
 
 # Load environment variables
 def load_env():
     env_vars = {}
     try:
         with open('.env', 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key] = value
-                    os.environ[key] = value
+            env_vars = dict(ENV_LINE_RE.findall(f.read()))
     except FileNotFoundError:
         pass
+    os.environ.update(env_vars)
     return env_vars
 
 # Load .env file
 load_env()
 
-def get_ai_response(user_message, conversation_history=None):
-    """
-    Send a message to Google Gemini and get a response
-    """
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        return "I'm sorry, but AI functionality is currently unavailable. Please set the GEMINI_API_KEY environment variable to enable AI responses."
+GEMINI_HOST = "generativelanguage.googleapis.com"
+GEMINI_PATH = "/v1beta/models/gemini-2.0-flash:generateContent"
+GEMINI_STREAM_PATH = "/v1beta/models/gemini-2.0-flash:streamGenerateContent?alt=sse"
+
+# The key only comes from the environment/.env at startup, so read it and build the request headers once
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+GEMINI_HEADERS = {
+    'Content-Type': 'application/json',
+    'X-goog-api-key': GEMINI_API_KEY
+} if GEMINI_API_KEY else None
+
+GEMINI_POOL_SIZE = 16  # idle keep-alive connections kept between requests
+
+# Keep-alive HTTPS connections shared by every handler thread (one thread per browser connection),
+# so chats skip the TCP + TLS handshake; LIFO hands out the most recently used first
+_gemini_pool = queue.LifoQueue(maxsize=GEMINI_POOL_SIZE)
+
+def checkout_gemini_connection():
+    """Take an idle pooled connection, or open a new one; returns (connection, whether it was reused)"""
+    try:
+        return _gemini_pool.get_nowait(), True
+    except queue.Empty:
+        return http.client.HTTPSConnection(GEMINI_HOST, timeout=60), False
+
+def release_gemini_connection(conn, response):
+    """Return a connection to the pool once its response has been fully read; otherwise close it"""
+    if response.isclosed():
+        try:
+            _gemini_pool.put_nowait(conn)
+            return
+        except queue.Full:
+            pass
+    # Unread bytes left on the socket would corrupt the next response
+    conn.close()
+
+def open_gemini_request(path, body, headers):
+    """POST a request body to Gemini on a pooled connection; returns (connection, unread response)"""
+    conn, reused = checkout_gemini_connection()
+    try:
+        conn.request('POST', path, body=body, headers=headers)
+        return conn, conn.getresponse()
+    except (http.client.HTTPException, OSError):
+        conn.close()
+        # The server may have dropped an idle keep-alive connection; retry once on a fresh one
+        if reused:
+            return open_gemini_request(path, body, headers)
+        raise
 
+def post_to_gemini(body, headers):
+    """POST a request body to Gemini; returns (status, response bytes)"""
+    conn, response = open_gemini_request(GEMINI_PATH, body, headers)
     try:
-        # Create the prompt with system context
-        full_prompt = """You are JetFriend, an intelligent AI travel companion. Follow these guidelines:
+        return response.status, response.read()
+    finally:
+        release_gemini_connection(conn, response)
+
+# System context prepended to every Gemini prompt
+SYSTEM_PROMPT = """You are JetFriend, an intelligent AI travel companion. Follow these guidelines:
 
 PERSONALITY & TONE:
 - Be friendly, enthusiastic, and knowledgeable about travel
@@ -75,193 +129,390 @@ I can suggest the best neighborhoods to stay in and must-see spots based on your
 
 """
 
-        # Add conversation history if provided
-        if conversation_history:
-            for msg in conversation_history:
-                role = "Human" if msg.get("role") == "user" else "Assistant"
-                full_prompt += f"{role}: {msg.get('content', '')}\n"
-
-        # Add current user message
-        full_prompt += f"Human: {user_message}\nAssistant:"
-
-        # Prepare the request payload for Gemini
-        payload = {
-            "contents": [
-                {
-                    "parts": [
-                        {
-                            "text": full_prompt
-                        }
-                    ]
-                }
-            ]
-        }
-
-        # Make the API request
-        url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
-        headers = {
-            'Content-Type': 'application/json',
-            'X-goog-api-key': api_key
-        }
-
-        # Create request
-        req = urllib.request.Request(
-            url, 
-            data=json.dumps(payload).encode('utf-8'),
-            headers=headers,
-            method='POST'
-        )
-
-        # Send request
-        with urllib.request.urlopen(req) as response:
-            if response.status == 200:
-                data = json.loads(response.read().decode())
-                if 'candidates' in data and len(data['candidates']) > 0:
-                    content = data['candidates'][0]['content']['parts'][0]['text']
-                    return content.strip()
-                else:
-                    return "I'm sorry, I didn't receive a proper response. Please try again."
-            else:
-                return f"I'm sorry, I'm having trouble connecting right now. Please try again in a moment. Error: {response.status}"
+# Gemini request body around the JSON-encoded prompt string: {"contents": [{"parts": [{"text": ...}]}]}
+GEMINI_BODY_PREFIX = b'{"contents": [{"parts": [{"text": '
+GEMINI_BODY_SUFFIX = b'}]}]}'
+# Body up to and including the system prompt, JSON-escaped once here; per request only the rest is escaped
+GEMINI_PROMPT_PREFIX = GEMINI_BODY_PREFIX + dumps_json(SYSTEM_PROMPT)[:-1]
+
+# /api/chat success body: {"success": true, "response": <reply>, "timestamp": <iso time>}
+CHAT_REPLY_PREFIX = b'{"success": true, "response": '
+
+# Largest /api/chat request body accepted; anything bigger is refused before it is read
+MAX_CHAT_BODY_BYTES = 256 * 1024
+
+# Closing fragment with the UTC timestamp, reformatted at most once per second: (epoch second, bytes)
+_chat_reply_tail = (0, b'')
+
+def chat_reply_tail():
+    """Return the ', "timestamp": "..."}' fragment for the current second"""
+    global _chat_reply_tail
+    now = int(time.time())
+    if _chat_reply_tail[0] != now:
+        stamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _chat_reply_tail = (now, f', "timestamp": "{stamp}"}}'.encode('utf-8'))
+    return _chat_reply_tail[1]
+
+class GeminiUnavailable(Exception):
+    """Gemini answered without a usable reply; the message is what the user sees"""
+
+def prompt_history(conversation_history):
+    """Hashable (role, content) pairs in the prompt's Human/Assistant form"""
+    return tuple(
+        ("Human" if msg.get("role") == "user" else "Assistant", str(msg.get('content', '')))
+        for msg in conversation_history or ()
+    )
+
+def build_payload(user_message, history=()):
+    """Gemini request body for the system prompt, (role, content) history pairs and the new message"""
+    # Add conversation history if provided, then the current user message
+    history_lines = [f"{role}: {content}\n" for role, content in history]
+    dynamic_prompt = "".join([*history_lines, f"Human: {user_message}\nAssistant:"])
 
+    # The payload shape and system prompt are fixed, so only the conversation needs serializing;
+    # its JSON string (minus the opening quote) continues the pre-escaped system prompt string
+    return GEMINI_PROMPT_PREFIX + dumps_json(dynamic_prompt)[1:] + GEMINI_BODY_SUFFIX
+
+def request_ai_response(user_message, history=()):
+    """
+    Call Google Gemini with (role, content) history pairs and return the reply text, raising on any failure
+    """
+    payload = build_payload(user_message, history)
+
+    # Send request
+    status, body = post_to_gemini(payload, GEMINI_HEADERS)
+    if status != 200:
+        raise GeminiUnavailable(f"I'm sorry, I'm having trouble connecting right now. Please try again in a moment. Error: {status}")
+    data = loads_json(body)
+    if 'candidates' in data and len(data['candidates']) > 0:
+        content = data['candidates'][0]['content']['parts'][0]['text']
+        return content.strip()
+    raise GeminiUnavailable("I'm sorry, I didn't receive a proper response. Please try again.")
+
+# Identical prompts with identical history get the same reply; failures raise and are never cached
+cached_ai_response = functools.lru_cache(maxsize=256)(request_ai_response)
+
+def get_ai_response(user_message, conversation_history=None, use_cache=True):
+    """
+    Send a message to Google Gemini and get a response
+    """
+    if not GEMINI_API_KEY:
+        return "I'm sorry, but AI functionality is currently unavailable. Please set the GEMINI_API_KEY environment variable to enable AI responses."
+
+    try:
+        fetch = cached_ai_response if use_cache else request_ai_response
+        return fetch(user_message, prompt_history(conversation_history))
+
+    except GeminiUnavailable as e:
+        return str(e)
     except Exception as e:
         return f"I'm sorry, I'm having trouble connecting right now. Please try again in a moment. Error: {str(e)}"
 
+def stream_ai_response(user_message, conversation_history=None):
+    """
+    Stream a Gemini response, yielding text chunks as Gemini produces them; raises on failure
+    """
+    if not GEMINI_API_KEY:
+        yield "I'm sorry, but AI functionality is currently unavailable. Please set the GEMINI_API_KEY environment variable to enable AI responses."
+        return
+
+    payload = build_payload(user_message, prompt_history(conversation_history))
+    conn, response = open_gemini_request(GEMINI_STREAM_PATH, payload, GEMINI_HEADERS)
+    try:
+        if response.status != 200:
+            response.read()
+            raise GeminiUnavailable(f"I'm sorry, I'm having trouble connecting right now. Please try again in a moment. Error: {response.status}")
+        # Gemini sends one "data: {...}" server-sent event per generated chunk
+        for line in response:
+            if not line.startswith(b'data:'):
+                continue
+            data = loads_json(line[5:])
+            for candidate in data.get('candidates', [])[:1]:
+                for part in candidate.get('content', {}).get('parts', []):
+                    if part.get('text'):
+                        yield part['text']
+        # Drain the chunked terminator so the connection can carry the next request
+        response.read()
+    finally:
+        # A stream abandoned part-way leaves unread bytes on the socket, so release closes it instead
+        release_gemini_connection(conn, response)
+
+# /api/test re-probes Gemini at most once a minute, so dashboard polling doesn't hammer the API
+TEST_PROBE_TTL = 60  # seconds
+TEST_PROBE_MESSAGE = "Hello! Can you tell me you're working correctly?"
+_test_probe = (None, None)  # (monotonic time of probe, reply)
+
+def probe_ai():
+    """Return a recent /api/test probe reply, asking Gemini again once the last one is older than TEST_PROBE_TTL"""
+    global _test_probe
+    probed_at, reply = _test_probe
+    if probed_at is None or time.monotonic() - probed_at >= TEST_PROBE_TTL:
+        reply = get_ai_response(TEST_PROBE_MESSAGE, use_cache=False)
+        _test_probe = (time.monotonic(), reply)
+    return reply
+
+def build_response(status, body=b'', content_type=b'application/json', extra_headers=b''):
+    """Serialize a complete HTTP/1.1 response (status line, CORS headers, body) to bytes"""
+    return (
+        b"HTTP/1.1 " + status + b"\r\n"
+        b"Content-Type: " + content_type + b"\r\n"
+        b"Access-Control-Allow-Origin: *\r\n" + extra_headers +
+        b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+    )
+
+# Fixed-shape responses, formatted once at import: (status code for the access log, raw response bytes)
+HEALTH_RESPONSE = (200, build_response(b"200 OK", dumps_json({
+    'status': 'healthy',
+    'service': 'JetFriend API',
+    'version': '1.0.0'
+})))
+TEST_UNCONFIGURED_RESPONSE = (503, build_response(b"503 Service Unavailable", dumps_json({
+    'success': False,
+    'error': 'GEMINI_API_KEY not configured',
+    'ai_status': 'disconnected',
+    'message': 'Please set the GEMINI_API_KEY environment variable to enable AI functionality.'
+})))
+PREFLIGHT_RESPONSE = (200, build_response(
+    b"200 OK",
+    content_type=b"text/plain",
+    extra_headers=b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\nAccess-Control-Allow-Headers: Content-Type\r\n"
+))
+
+# index.html held in memory and re-read only when its mtime changes: (mtime, bytes)
+_index_cache = (None, b'')
+
+def load_index(directory):
+    """Return index.html's bytes from memory, reloading it if the file changed on disk"""
+    global _index_cache
+    path = os.path.join(directory, 'index.html')
+    mtime = os.stat(path).st_mtime
+    if _index_cache[0] != mtime:
+        with open(path, 'rb') as f:
+            _index_cache = (mtime, f.read())
+    return _index_cache[1]
+
 class JetFriendHandler(http.server.SimpleHTTPRequestHandler):
+    # HTTP/1.1 keeps browser connections open between chats; every response below sets Content-Length
+    protocol_version = "HTTP/1.1"
+    # Close keep-alive connections that sit idle this long (seconds), so they don't pin a handler thread forever
+    timeout = 30
+    # Buffer writes so status line, headers and a small body leave in one send(); flushed after each request
+    wbufsize = 65536
+    # Small JSON replies go out immediately instead of waiting on Nagle's algorithm
+    disable_nagle_algorithm = True
+
+    def send_prebuilt(self, prebuilt):
+        """Write one of the precomputed (status, bytes) responses"""
+        status, response = prebuilt
+        self.log_request(status)
+        self.wfile.write(response)
+
+    def send_json(self, status, *body_parts):
+        """Send a JSON response whose body is the given byte fragments"""
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Content-Length', str(sum(len(part) for part in body_parts)))
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        for part in body_parts:
+            self.wfile.write(part)
+
     def do_GET(self):
-        if self.path == "/":
-            self.path = "/index.html"
-        elif self.path == "/api/health":
+        if self.path in ("/", "/index.html"):
+            try:
+                body = load_index(self.directory)
+            except OSError:
+                self.send_error(404, "File not found")
+                return
             self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
             self.end_headers()
-            response = {
-                'status': 'healthy',
-                'service': 'JetFriend API',
-                'version': '1.0.0'
-            }
-            self.wfile.write(json.dumps(response).encode())
+            self.wfile.write(body)
+            return
+        elif self.path == "/api/health":
+            self.send_prebuilt(HEALTH_RESPONSE)
             return
         elif self.path == "/api/test":
-            api_key = os.getenv("GEMINI_API_KEY")
-            if not api_key:
-                self.send_response(503)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                response = {
-                    'success': False,
-                    'error': 'GEMINI_API_KEY not configured',
-                    'ai_status': 'disconnected',
-                    'message': 'Please set the GEMINI_API_KEY environment variable to enable AI functionality.'
-                }
-                self.wfile.write(json.dumps(response).encode())
+            if not GEMINI_API_KEY:
+                self.send_prebuilt(TEST_UNCONFIGURED_RESPONSE)
                 return
             
             try:
-                test_response = get_ai_response("Hello! Can you tell me you're working correctly?")
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
+                test_response = probe_ai()
                 response = {
                     'success': True,
                     'test_response': test_response,
                     'ai_status': 'connected'
                 }
-                self.wfile.write(json.dumps(response).encode())
+                self.send_json(200, dumps_json(response))
                 return
             except Exception as e:
-                self.send_response(500)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
                 response = {
                     'success': False,
                     'error': str(e),
                     'ai_status': 'disconnected'
                 }
-                self.wfile.write(json.dumps(response).encode())
+                self.send_json(500, dumps_json(response))
                 return
         
         return super().do_GET()
     
+    def read_body(self):
+        """Read the request body, or send an error and return None if its Content-Length is bad or too large"""
+        try:
+            content_length = int(self.headers.get('Content-Length', '0'))
+        except ValueError:
+            content_length = -1
+        if content_length < 0 or content_length > MAX_CHAT_BODY_BYTES:
+            # The body is left unread, so the connection can't be reused
+            self.close_connection = True
+            status = 413 if content_length > MAX_CHAT_BODY_BYTES else 400
+            self.send_json(status, dumps_json({'error': 'Request body too large' if status == 413 else 'Invalid Content-Length'}))
+            return None
+        post_data = bytearray(content_length)
+        self.rfile.readinto(post_data)
+        return post_data
+
+    def send_event(self, event):
+        """Write one server-sent event and push it to the client immediately"""
+        self.wfile.write(b'data: ' + dumps_json(event) + b'\n\n')
+        self.wfile.flush()
+
     def do_POST(self):
         if self.path == "/api/chat":
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
+            post_data = self.read_body()
+            if post_data is None:
+                return
             
             try:
-                data = json.loads(post_data.decode())
+                data = loads_json(post_data)
                 user_message = data.get('message', '').strip()
                 conversation_history = data.get('history', [])
                 
                 if not user_message:
                     response = {'error': 'Message is required'}
-                    self.wfile.write(json.dumps(response).encode())
+                    self.send_json(200, dumps_json(response))
                     return
                 
                 # Get AI response using Gemini API
                 ai_response = get_ai_response(user_message, conversation_history)
                 
-                response = {
-                    'success': True,
-                    'response': ai_response,
-                    'timestamp': datetime.now().isoformat()
-                }
-                
             except Exception as e:
                 response = {
                     'success': False,
                     'error': 'Internal server error',
                     'message': 'Sorry, I encountered an error processing your request.'
                 }
+                self.send_json(200, dumps_json(response))
+                return
             
-            self.wfile.write(json.dumps(response).encode())
+            # Only the reply text needs JSON escaping; the fixed framing around it is written as-is
+            self.send_json(
+                200,
+                CHAT_REPLY_PREFIX,
+                dumps_json(ai_response),
+                chat_reply_tail()
+            )
             return
         
+        if self.path == "/api/chat/stream":
+            post_data = self.read_body()
+            if post_data is None:
+                return
+
+            try:
+                data = loads_json(post_data)
+                user_message = data.get('message', '').strip()
+                conversation_history = data.get('history', [])
+            except Exception:
+                user_message = ''
+
+            if not user_message:
+                self.send_json(400, dumps_json({'error': 'Message is required'}))
+                return
+
+            # Forward each Gemini chunk to the browser as a server-sent event; the stream's end is the connection's end
+            self.close_connection = True
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+
+            try:
+                for chunk in stream_ai_response(user_message, conversation_history):
+                    self.send_event({'delta': chunk})
+                self.send_event({'done': True})
+            except GeminiUnavailable as e:
+                self.send_event({'error': 'Upstream error', 'message': str(e)})
+            except Exception:
+                self.send_event({
+                    'error': 'Internal server error',
+                    'message': "I'm sorry, I'm having trouble connecting right now. Please try again in a moment."
+                })
+            return
+        
+        # The request body was not read, so this connection can't carry another request
         self.send_response(405)
+        self.send_header('Content-Length', '0')
+        self.send_header('Connection', 'close')
         self.end_headers()
     
     def do_OPTIONS(self):
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
+        self.send_prebuilt(PREFLIGHT_RESPONSE)
 
 if __name__ == "__main__":
     port = int(os.environ.get('PORT', 5000))
     debug_mode = os.environ.get('DEBUG', 'False').lower() == 'true'
+    workers = max(1, int(os.environ.get('WORKERS', 1)))
 
-    class ReusableTCPServer(socketserver.TCPServer):
+    # One thread per connection so a slow Gemini call doesn't stall other clients or health checks.
+    # With several workers, SO_REUSEPORT lets each process bind the same port and the kernel spreads
+    # connections across them; a single worker leaves it off so a second instance fails with EADDRINUSE.
+    class ReusableTCPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
         allow_reuse_address = True
+        daemon_threads = True
+        reuse_port = workers > 1
 
-    # Try to start server, if port busy try next port
-    max_attempts = 10
-    for attempt in range(max_attempts):
-        try:
-            with ReusableTCPServer(("", port), JetFriendHandler) as httpd:
-                print(f"🚀 JetFriend API starting on port {port}")
+        def server_bind(self):
+            if self.reuse_port and hasattr(socket, 'SO_REUSEPORT'):
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            super().server_bind()
+
+    # Fork the extra workers before binding so each process gets its own listening socket
+    is_primary = True
+    worker_pids = []
+    if workers > 1 and hasattr(os, 'fork'):
+        for _ in range(workers - 1):
+            pid = os.fork()
+            if pid == 0:
+                is_primary = False
+                worker_pids = []
+                break
+            worker_pids.append(pid)
+    if worker_pids:
+        # Turn SIGTERM into a normal exit so the workers are stopped along with the primary
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    try:
+        with ReusableTCPServer(("", port), JetFriendHandler) as httpd:
+            if is_primary:
+                print(f"🚀 JetFriend API starting on port {port} ({workers} worker{'s' if workers > 1 else ''})")
                 print(f"🌐 Visit: http://localhost:{port}")
-                if os.getenv("GEMINI_API_KEY"):
+                if GEMINI_API_KEY:
                     print("✅ Gemini AI integration enabled")
                 else:
                     print("⚠️  Gemini AI integration disabled - no API key found")
-                httpd.serve_forever()
-                break
-        except OSError as e:
-            if e.errno == 98:  # Address already in use
-                print(f"⚠️  Port {port} is busy, trying port {port + 1}")
-                port += 1
-                if attempt == max_attempts - 1:
-                    print(f"❌ Could not find available port after {max_attempts} attempts")
-                    exit(1)
-            else:
-                raise e
+            httpd.serve_forever()
+    except OSError as e:
+        if e.errno == errno.EADDRINUSE:
+            print(f"❌ Port {port} is already in use; set PORT to choose another")
+            exit(1)
+        raise
+    finally:
+        for pid in worker_pids:
+            os.kill(pid, signal.SIGTERM)
@@ -1,13 +1,20 @@
 #!/usr/bin/env python3
+import functools
+import hashlib
+import http.client
 import http.server
+import math
 import socketserver
-import json
+import threading
+import time
 import urllib.parse
 import os
-import urllib.request
+import queue
 from datetime import datetime
 import re
 
+from json_helpers import dumps_json, loads_json
+
 # Load environment variables
 def load_env():
     env_vars = {}
@@ -26,17 +33,133 @@ def load_env():
 # Load .env file
 load_env()
 
-def get_ai_response_openai(user_message, conversation_history=None, places_data=None):
-    """
-    Send a message to OpenAI ChatGPT and get a response with place cards
-    """
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key or api_key == "your-openai-key-here":
-        return "I'm sorry, but AI functionality is currently unavailable. Please set your OPENAI_API_KEY environment variable to enable AI responses."
+def _valid(key):
+    """Return an API key, or None when it is unset or still the placeholder value"""
+    return key if key and key != "your-openai-key-here" else None
+
+# Read once at import rather than on every request
+OPENAI_API_KEY = _valid(os.getenv("OPENAI_API_KEY"))
+OPENAI_HEADERS = {
+    'Content-Type': 'application/json',
+    'Authorization': f'Bearer {OPENAI_API_KEY}'
+} if OPENAI_API_KEY else None
+
+OPENAI_HOST = "api.openai.com"
+OPENAI_CHAT_PATH = "/v1/chat/completions"
+OPENAI_EMBEDDINGS_PATH = "/v1/embeddings"
+
+OPENAI_POOL_SIZE = 16  # idle keep-alive connections kept between requests
+
+# Keep-alive HTTPS connections shared by every handler thread, so chats skip the TCP + TLS handshake
+# even though each browser connection gets its own thread; LIFO hands out the most recently used first
+_openai_pool = queue.LifoQueue(maxsize=OPENAI_POOL_SIZE)
 
+def checkout_openai_connection():
+    """Take an idle pooled connection, or open a new one; returns (connection, whether it was reused)"""
     try:
-        # Create system prompt
-        system_prompt = """You are JetFriend, an intelligent AI travel companion. 
+        return _openai_pool.get_nowait(), True
+    except queue.Empty:
+        return http.client.HTTPSConnection(OPENAI_HOST, timeout=60), False
+
+def release_openai_connection(conn, response):
+    """Return a connection to the pool once its response has been fully read; otherwise close it"""
+    if response.isclosed():
+        try:
+            _openai_pool.put_nowait(conn)
+            return
+        except queue.Full:
+            pass
+    # Unread bytes left on the socket would corrupt the next response
+    conn.close()
+
+def open_openai_request(path, body, headers):
+    """POST a request body to an OpenAI endpoint on a pooled connection; returns (connection, unread response)"""
+    conn, reused = checkout_openai_connection()
+    try:
+        conn.request('POST', path, body=body, headers=headers)
+        return conn, conn.getresponse()
+    except (http.client.HTTPException, OSError):
+        conn.close()
+        # The server may have dropped an idle keep-alive connection; retry once on a fresh one
+        if reused:
+            return open_openai_request(path, body, headers)
+        raise
+
+def post_to_openai(path, body, headers):
+    """POST a request body to an OpenAI endpoint; returns (status, response bytes)"""
+    conn, response = open_openai_request(path, body, headers)
+    try:
+        return response.status, response.read()
+    finally:
+        release_openai_connection(conn, response)
+
+# Opt-in semantic cache: paraphrased repeats ("best restaurants in Paris" / "top Paris restaurants")
+# reuse an earlier answer instead of paying for another chat completion
+SEMANTIC_CACHE_ENABLED = os.getenv('SEMANTIC_CACHE', 'False').lower() == 'true'
+SEMANTIC_CACHE_MODEL = "text-embedding-3-small"
+SEMANTIC_CACHE_DIMENSIONS = 256
+SEMANTIC_CACHE_THRESHOLD = 0.92  # cosine similarity
+SEMANTIC_CACHE_TTL = 3600  # seconds
+SEMANTIC_CACHE_MAX_ENTRIES = 512
+SEMANTIC_CACHE_HISTORY_TURNS = 2
+_semantic_cache = []  # (unit vector, places fingerprint, response, stored at)
+_semantic_cache_lock = threading.Lock()
+
+def get_semantic_cache_text(user_message, conversation_history=None):
+    """Normalized text identifying a question: the last few turns plus the new message"""
+    turns = [msg.get("content", "") for msg in (conversation_history or [])[-SEMANTIC_CACHE_HISTORY_TURNS:]]
+    turns.append(user_message)
+    return "\n".join(" ".join(turn.lower().split()) for turn in turns)
+
+# Every place field build_chat_payload copies into the prompt (it uses the top 3 places)
+PLACE_PROMPT_KEYS = ('name', 'address', 'rating', 'rating_count', 'image_url', 'google_maps_url', 'website')
+
+def get_places_fingerprint(places_data=None):
+    """
+    Identify the place data (and so the location) a response was written around, so
+    "restaurants in Tokyo" never reuses an answer built for "restaurants in NYC"
+    """
+    if not places_data:
+        return ""
+    prompt_fields = [[place.get(key) for key in PLACE_PROMPT_KEYS] for place in places_data[:3]]
+    return hashlib.sha256(dumps_json(prompt_fields)).hexdigest()
+
+def embed_text(text):
+    """Embed text with the OpenAI embeddings API and return it as a unit vector"""
+    payload = {"model": SEMANTIC_CACHE_MODEL, "input": text, "dimensions": SEMANTIC_CACHE_DIMENSIONS}
+    status, body = post_to_openai(OPENAI_EMBEDDINGS_PATH, dumps_json(payload), OPENAI_HEADERS)
+    if status != 200:
+        raise RuntimeError(f"Embeddings request failed with status {status}")
+    vector = loads_json(body)['data'][0]['embedding']
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return [value / norm for value in vector]
+
+def lookup_semantic_cache(vector, places_fingerprint=""):
+    """Return the most similar unexpired cached response for the same places, if it clears the threshold"""
+    now = time.time()
+    best_score = 0.0
+    best_response = None
+
+    with _semantic_cache_lock:
+        _semantic_cache[:] = [entry for entry in _semantic_cache if now - entry[3] < SEMANTIC_CACHE_TTL]
+        for cached_vector, cached_fingerprint, response, _ in _semantic_cache:
+            if cached_fingerprint != places_fingerprint:
+                continue
+            score = sum(a * b for a, b in zip(vector, cached_vector))
+            if score > best_score:
+                best_score = score
+                best_response = response
+
+    return best_response if best_score >= SEMANTIC_CACHE_THRESHOLD else None
+
+def store_semantic_cache(vector, response, places_fingerprint=""):
+    """Remember a successful response, evicting the oldest entry once full"""
+    with _semantic_cache_lock:
+        if len(_semantic_cache) >= SEMANTIC_CACHE_MAX_ENTRIES:
+            _semantic_cache.pop(0)
+        _semantic_cache.append((vector, places_fingerprint, response, time.time()))
+
+SYSTEM_PROMPT = """You are JetFriend, an intelligent AI travel companion. 
 
 PERSONALITY & TONE:
 - Be friendly, enthusiastic, and knowledgeable about travel
@@ -74,70 +197,123 @@ When recommending places, always use this format:
     </div>
   </div>
 </div>"""
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+def build_chat_payload(user_message, conversation_history=None, places_data=None, stream=False):
+    """Serialize the chat completions request for a message, its recent history and any place data"""
+    # Build messages array
+    messages = [SYSTEM_MESSAGE]
+
+    # Add conversation history
+    if conversation_history:
+        for msg in conversation_history[-6:]:  # Keep last 6 messages
+            role = "user" if msg.get("role") == "user" else "assistant"
+            messages.append({"role": role, "content": msg.get("content", "")})
+
+    # Enhanced user message with places data
+    enhanced_message = user_message
+    if places_data and len(places_data) > 0:
+        parts = [user_message, "\n\nREAL PLACE DATA FOR YOUR RESPONSE:\n"]
+        for i, place in enumerate(places_data[:3], 1):  # Top 3 places
+            parts.append(
+                f"{i}. {place['name']}\n"
+                f"   Address: {place['address']}\n"
+                f"   Rating: {place['rating']} ({place['rating_count']} reviews)\n"
+                f"   Image: {place['image_url']}\n"
+                f"   Google Maps: {place['google_maps_url']}\n"
+            )
+            if place['website']:
+                parts.append(f"   Website: {place['website']}\n")
+            parts.append("\n")
+
+        parts.append("INSTRUCTIONS: Use this real data to create place cards in your response using the exact format specified in your system prompt.")
+        enhanced_message = "".join(parts)
+
+    messages.append({"role": "user", "content": enhanced_message})
+
+    # Prepare OpenAI API request
+    payload = {
+        "model": "gpt-3.5-turbo",  # Using gpt-3.5-turbo for better cost efficiency
+        "messages": messages,
+        "max_tokens": 2000,
+        "temperature": 0.7
+    }
+    if stream:
+        payload["stream"] = True
+    return dumps_json(payload)
 
-        # Build messages array
-        messages = [{"role": "system", "content": system_prompt}]
-        
-        # Add conversation history
-        if conversation_history:
-            for msg in conversation_history[-6:]:  # Keep last 6 messages
-                role = "user" if msg.get("role") == "user" else "assistant"
-                messages.append({"role": role, "content": msg.get("content", "")})
-
-        # Enhanced user message with places data
-        enhanced_message = user_message
-        if places_data and len(places_data) > 0:
-            enhanced_message += "\n\nREAL PLACE DATA FOR YOUR RESPONSE:\n"
-            for i, place in enumerate(places_data[:3], 1):  # Top 3 places
-                enhanced_message += f"{i}. {place['name']}\n"
-                enhanced_message += f"   Address: {place['address']}\n"
-                enhanced_message += f"   Rating: {place['rating']} ({place['rating_count']} reviews)\n"
-                enhanced_message += f"   Image: {place['image_url']}\n"
-                enhanced_message += f"   Google Maps: {place['google_maps_url']}\n"
-                if place['website']:
-                    enhanced_message += f"   Website: {place['website']}\n"
-                enhanced_message += "\n"
-            
-            enhanced_message += "INSTRUCTIONS: Use this real data to create place cards in your response using the exact format specified in your system prompt."
-
-        messages.append({"role": "user", "content": enhanced_message})
+def get_ai_response_openai(user_message, conversation_history=None, places_data=None):
+    """
+    Send a message to OpenAI ChatGPT and get a response with place cards
+    """
+    if OPENAI_API_KEY is None:
+        return "I'm sorry, but AI functionality is currently unavailable. Please set your OPENAI_API_KEY environment variable to enable AI responses."
 
-        # Prepare OpenAI API request
-        payload = {
-            "model": "gpt-3.5-turbo",  # Using gpt-3.5-turbo for better cost efficiency
-            "messages": messages,
-            "max_tokens": 2000,
-            "temperature": 0.7
-        }
+    try:
+        semantic_vector = None
+        places_fingerprint = get_places_fingerprint(places_data)
+        if SEMANTIC_CACHE_ENABLED:
+            try:
+                semantic_vector = embed_text(get_semantic_cache_text(user_message, conversation_history))
+                cached_response = lookup_semantic_cache(semantic_vector, places_fingerprint)
+                if cached_response:
+                    return cached_response
+            except Exception as e:
+                print(f"⚠️  Semantic cache lookup failed: {e}")
+                semantic_vector = None
 
         # Make API request to OpenAI
-        url = "https://api.openai.com/v1/chat/completions"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {api_key}'
-        }
-
-        req = urllib.request.Request(
-            url, 
-            data=json.dumps(payload).encode('utf-8'),
-            headers=headers,
-            method='POST'
-        )
-
-        with urllib.request.urlopen(req) as response:
-            if response.status == 200:
-                data = json.loads(response.read().decode())
-                if 'choices' in data and len(data['choices']) > 0:
-                    content = data['choices'][0]['message']['content']
-                    return content.strip()
-                else:
-                    return "I'm sorry, I didn't receive a proper response. Please try again."
+        payload = build_chat_payload(user_message, conversation_history, places_data)
+        status, body = post_to_openai(OPENAI_CHAT_PATH, payload, OPENAI_HEADERS)
+        if status == 200:
+            data = loads_json(body)
+            if 'choices' in data and len(data['choices']) > 0:
+                content = data['choices'][0]['message']['content'].strip()
+                if semantic_vector is not None:
+                    store_semantic_cache(semantic_vector, content, places_fingerprint)
+                return content
             else:
-                return f"I'm sorry, I'm having trouble connecting right now. Please try again in a moment. Error: {response.status}"
+                return "I'm sorry, I didn't receive a proper response. Please try again."
+        else:
+            return f"I'm sorry, I'm having trouble connecting right now. Please try again in a moment. Error: {status}"
 
     except Exception as e:
         return f"I'm sorry, I'm having trouble connecting right now. Please try again in a moment. Error: {str(e)}"
 
+class OpenAIUnavailable(Exception):
+    """OpenAI could not produce a response; the message is safe to show to the user"""
+
+def stream_ai_response_openai(user_message, conversation_history=None, places_data=None):
+    """
+    Stream an OpenAI response, yielding text chunks as they are generated; raises on failure
+    """
+    if OPENAI_API_KEY is None:
+        yield "I'm sorry, but AI functionality is currently unavailable. Please set your OPENAI_API_KEY environment variable to enable AI responses."
+        return
+
+    payload = build_chat_payload(user_message, conversation_history, places_data, stream=True)
+    conn, response = open_openai_request(OPENAI_CHAT_PATH, payload, OPENAI_HEADERS)
+    try:
+        if response.status != 200:
+            response.read()
+            raise OpenAIUnavailable(f"I'm sorry, I'm having trouble connecting right now. Please try again in a moment. Error: {response.status}")
+        # OpenAI sends one "data: {...}" server-sent event per token batch, then "data: [DONE]"
+        for line in response:
+            if not line.startswith(b'data:'):
+                continue
+            data = line[5:].strip()
+            if data == b'[DONE]':
+                break
+            for choice in loads_json(data).get('choices', [])[:1]:
+                content = choice.get('delta', {}).get('content')
+                if content:
+                    yield content
+        # Drain the rest of the chunked body so the connection can carry the next request
+        response.read()
+    finally:
+        # A stream abandoned part-way leaves unread bytes on the socket, so release closes it instead
+        release_openai_connection(conn, response)
+
 # Default fallback image (guaranteed to work)
 DEFAULT_PLACE_IMAGE = 'https://images.pexels.com/photos/315755/pexels-photo-315755.jpeg?auto=compress&cs=tinysrgb&w=600'
 
@@ -183,7 +359,12 @@ def search_places_keyword(query, location=None):
     """
     Search for places using predefined keyword images
     """
-    query_lower = query.lower()
+    # Callers may mutate the place dicts, so hand out copies of the cached results
+    return [dict(place) for place in _search_places_cached(query.lower().strip(), location)]
+
+@functools.lru_cache(maxsize=1024)
+def _search_places_cached(query_lower, location):
+    """Build the keyword place results for a normalized query; memoized, returned as a tuple"""
     places = []
 
     # Look for keyword matches in the query
@@ -230,58 +411,87 @@ def search_places_keyword(query, location=None):
             'rating': 4.0,
             'rating_count': 150,
             'image_url': default_image,
-            'google_maps_url': f"https://www.google.com/maps/search/{urllib.parse.quote_plus(query)}+{urllib.parse.quote_plus(location or '')}",
+            'google_maps_url': f"https://www.google.com/maps/search/{urllib.parse.quote_plus(query_lower)}+{urllib.parse.quote_plus(location or '')}",
             'website': '',
             'place_id': 'keyword_generic'
         }
         places.append(place_info)
 
-    return places
+    return tuple(places)
+
+LOCATION_KEYWORDS = [
+    'restaurant', 'hotel', 'attraction', 'museum', 'park', 'bar', 'cafe',
+    'where', 'visit', 'see', 'eat', 'stay', 'near', 'in ', 'at ',
+    'best places', 'things to do', 'activities', 'food', 'drink'
+]
+# Keywords match anywhere in the message (plain substrings, like the old `in` checks), in one regex pass
+LOCATION_KEYWORDS_RE = re.compile('|'.join(map(re.escape, LOCATION_KEYWORDS)), re.IGNORECASE)
+
+# "in Paris", "near Tokyo": the place name after a location preposition
+LOCATION_EXTRACT_RE = re.compile(r'(?:in|at|near)\s+([A-Za-z\s]+?)(?:\s|$|[.,!?])', re.IGNORECASE)
 
 def detect_location_query(message):
     """
     Detect if user query requires location data
     """
-    location_keywords = [
-        'restaurant', 'hotel', 'attraction', 'museum', 'park', 'bar', 'cafe',
-        'where', 'visit', 'see', 'eat', 'stay', 'near', 'in ', 'at ',
-        'best places', 'things to do', 'activities', 'food', 'drink'
-    ]
-    
-    message_lower = message.lower()
-    return any(keyword in message_lower for keyword in location_keywords)
+    return LOCATION_KEYWORDS_RE.search(message) is not None
+
+def find_places(user_message):
+    """Look up place data for a message that asks about a location; empty otherwise"""
+    if not detect_location_query(user_message):
+        return []
+    # Extract location from message
+    location_match = LOCATION_EXTRACT_RE.search(user_message)
+    location = location_match.group(1).strip() if location_match else None
+    return search_places_keyword(user_message, location)
+
+def build_response(status, body=b'', content_type=b'application/json', extra_headers=b''):
+    """Serialize a complete HTTP/1.0 response (status line, CORS headers, body) to bytes"""
+    return (
+        b"HTTP/1.0 " + status + b"\r\n"
+        b"Content-Type: " + content_type + b"\r\n"
+        b"Access-Control-Allow-Origin: *\r\n" + extra_headers +
+        b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+    )
+
+# Fixed-shape responses, formatted once at import: (status code for the access log, raw response bytes)
+HEALTH_RESPONSE = (200, build_response(b"200 OK", dumps_json({
+    'status': 'healthy',
+    'service': 'JetFriend API (Keyword Images Version)',
+    'version': '2.1.0',
+    'apis_configured': {
+        'openai': OPENAI_API_KEY is not None,
+        'keyword_images': True,
+        'available_keywords': len(KEYWORD_IMAGES)
+    }
+})))
+PREFLIGHT_RESPONSE = (200, build_response(
+    b"200 OK",
+    content_type=b"text/plain",
+    extra_headers=b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\nAccess-Control-Allow-Headers: Content-Type\r\n"
+))
 
 class JetFriendHandler(http.server.SimpleHTTPRequestHandler):
+    def send_prebuilt(self, prebuilt):
+        """Write one of the precomputed (status, bytes) responses in a single call"""
+        status, response = prebuilt
+        self.log_request(status)
+        self.wfile.write(response)
+
+    def send_event(self, event):
+        """Write one server-sent event and push it to the client immediately"""
+        self.wfile.write(b'data: ' + dumps_json(event) + b'\n\n')
+        self.wfile.flush()
+
     def do_GET(self):
         if self.path == "/":
             self.path = "/index.html"
         elif self.path == "/api/health":
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            # Check API status
-            openai_status = bool(os.getenv("OPENAI_API_KEY") and os.getenv("OPENAI_API_KEY") != "your-openai-key-here")
-
-            response = {
-                'status': 'healthy',
-                'service': 'JetFriend API (Keyword Images Version)',
-                'version': '2.1.0',
-                'apis_configured': {
-                    'openai': openai_status,
-                    'keyword_images': True,
-                    'available_keywords': len(KEYWORD_IMAGES)
-                }
-            }
-            self.wfile.write(json.dumps(response).encode())
+            self.send_prebuilt(HEALTH_RESPONSE)
             return
         elif self.path == "/api/test":
             # Test both APIs
-            openai_key = os.getenv("OPENAI_API_KEY")
-            google_key = os.getenv("GOOGLE_PLACES_API_KEY")
-            
-            if not openai_key or openai_key == "your-openai-key-here":
+            if OPENAI_API_KEY is None:
                 self.send_response(503)
                 self.send_header('Content-Type', 'application/json')
                 self.send_header('Access-Control-Allow-Origin', '*')
@@ -291,7 +501,7 @@ class JetFriendHandler(http.server.SimpleHTTPRequestHandler):
                     'error': 'OPENAI_API_KEY not configured',
                     'message': 'Please set your OPENAI_API_KEY environment variable.'
                 }
-                self.wfile.write(json.dumps(response).encode())
+                self.wfile.write(dumps_json(response))
                 return
             
             try:
@@ -309,7 +519,7 @@ class JetFriendHandler(http.server.SimpleHTTPRequestHandler):
                     'openai_status': 'connected',
                     'keyword_images_status': 'active'
                 }
-                self.wfile.write(json.dumps(response).encode())
+                self.wfile.write(dumps_json(response))
                 return
             except Exception as e:
                 self.send_response(500)
@@ -321,7 +531,7 @@ class JetFriendHandler(http.server.SimpleHTTPRequestHandler):
                     'error': str(e),
                     'openai_status': 'disconnected'
                 }
-                self.wfile.write(json.dumps(response).encode())
+                self.wfile.write(dumps_json(response))
                 return
         
         return super().do_GET()
@@ -337,24 +547,17 @@ class JetFriendHandler(http.server.SimpleHTTPRequestHandler):
             self.end_headers()
             
             try:
-                data = json.loads(post_data.decode())
+                data = loads_json(post_data)
                 user_message = data.get('message', '').strip()
                 conversation_history = data.get('history', [])
                 
                 if not user_message:
                     response = {'error': 'Message is required'}
-                    self.wfile.write(json.dumps(response).encode())
+                    self.wfile.write(dumps_json(response))
                     return
                 
                 # Check if query needs location data
-                places_data = []
-                if detect_location_query(user_message):
-                    # Extract location from message
-                    location_match = re.search(r'(?:in|at|near)\s+([A-Za-z\s]+?)(?:\s|$|[.,!?])', user_message, re.IGNORECASE)
-                    location = location_match.group(1).strip() if location_match else None
-                    
-                    # Search for places
-                    places_data = search_places_keyword(user_message, location)
+                places_data = find_places(user_message)
                 
                 # Get AI response with places data
                 ai_response = get_ai_response_openai(user_message, conversation_history, places_data)
@@ -373,24 +576,62 @@ class JetFriendHandler(http.server.SimpleHTTPRequestHandler):
                     'message': f'Sorry, I encountered an error: {str(e)}'
                 }
             
-            self.wfile.write(json.dumps(response).encode())
+            self.wfile.write(dumps_json(response))
             return
-        
+
+        if self.path == "/api/chat/stream":
+            content_length = int(self.headers['Content-Length'])
+            post_data = self.rfile.read(content_length)
+
+            try:
+                data = loads_json(post_data)
+                user_message = data.get('message', '').strip()
+                conversation_history = data.get('history', [])
+            except Exception:
+                user_message = ''
+
+            if not user_message:
+                self.send_response(400)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+                self.wfile.write(dumps_json({'error': 'Message is required'}))
+                return
+
+            # Forward each OpenAI chunk to the browser as a server-sent event as soon as it arrives
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+
+            try:
+                places_data = find_places(user_message)
+                for chunk in stream_ai_response_openai(user_message, conversation_history, places_data):
+                    self.send_event({'delta': chunk})
+                self.send_event({'done': True, 'places_found': len(places_data)})
+            except OpenAIUnavailable as e:
+                self.send_event({'error': 'Upstream error', 'message': str(e)})
+            except Exception:
+                self.send_event({
+                    'error': 'Internal server error',
+                    'message': "I'm sorry, I'm having trouble connecting right now. Please try again in a moment."
+                })
+            return
+
         self.send_response(405)
         self.end_headers()
     
     def do_OPTIONS(self):
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
+        self.send_prebuilt(PREFLIGHT_RESPONSE)
 
 if __name__ == "__main__":
     port = int(os.environ.get('PORT', 5002))
 
-    class ReusableTCPServer(socketserver.TCPServer):
+    # One thread per connection so a slow OpenAI call doesn't stall other clients or health checks
+    class ReusableTCPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
         allow_reuse_address = True
+        daemon_threads = True
 
     # Try to start server, if port busy try next port
     max_attempts = 10
@@ -404,7 +645,7 @@ if __name__ == "__main__":
             print(f"📊 Server status: RUNNING on 0.0.0.0:{port}")
 
             # Check API configuration
-            openai_configured = bool(os.getenv("OPENAI_API_KEY") and os.getenv("OPENAI_API_KEY") != "your-openai-key-here")
+            openai_configured = OPENAI_API_KEY is not None
 
             print(f"🤖 OpenAI ChatGPT: {'✅ Connected' if openai_configured else '❌ Not configured'}")
             print(f"📍 Keyword Images: ✅ Active with {len(KEYWORD_IMAGES)} predefined categories")
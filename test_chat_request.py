@@ -0,0 +1,96 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+import app
+
+
+class ChatRequestValidationTests(unittest.TestCase):
+    def setUp(self):
+        self.client = app.app.test_client()
+        patcher = mock.patch.object(app, 'get_ai_response', return_value='Sure!')
+        self.get_ai_response = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_blank_message_is_rejected(self):
+        response = self.client.post('/api/chat', json={'message': '   '})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'Message is required')
+
+    def test_malformed_history_is_rejected(self):
+        response = self.client.post('/api/chat', json={'message': 'Hi', 'history': [{'role': 'system', 'content': 'x'}]})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'Invalid request')
+        self.get_ai_response.assert_not_called()
+
+    def test_history_is_passed_on_as_dicts(self):
+        history = [{'role': 'user', 'content': ' Going to Rome '}, {'role': 'assistant', 'content': 'Great choice!'}]
+
+        response = self.client.post('/api/chat', json={'message': ' What should I eat? ', 'history': history})
+
+        self.assertEqual(response.status_code, 200)
+        args = self.get_ai_response.call_args[0]
+        self.assertEqual(args[0], 'What should I eat?')
+        self.assertEqual(args[1], [{'role': 'user', 'content': 'Going to Rome'}, {'role': 'assistant', 'content': 'Great choice!'}])
+
+
+def make_stream(*texts):
+    stream = mock.MagicMock()
+    stream.__enter__.return_value = stream
+    stream.__iter__.return_value = iter([mock.Mock(choices=[mock.Mock(delta=mock.Mock(content=text))]) for text in texts])
+    return stream
+
+
+class ChatStreamTests(unittest.TestCase):
+    def setUp(self):
+        app._response_cache.clear()
+        self.addCleanup(app._response_cache.clear)
+        self.client = app.app.test_client()
+        self.openai_client = mock.Mock()
+        self.openai_client.chat.completions.create.return_value = make_stream('Try ', 'the ', None, 'gelato!')
+        patcher = mock.patch.object(app, 'openai_client', self.openai_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reply_is_streamed_as_server_sent_events(self):
+        response = self.client.post('/api/chat/stream', json={'message': 'Any dessert tips?'})
+        body = response.get_data(as_text=True)
+
+        self.assertEqual(response.mimetype, 'text/event-stream')
+        self.assertEqual(body.count('"delta"'), 3)
+        self.assertIn('"done":true', body)
+        self.assertEqual([entry[0] for entry in app._response_cache.values()], ['Try the gelato!'])
+
+    def test_abandoned_stream_is_closed(self):
+        stream = self.openai_client.chat.completions.create.return_value
+        chunks = app.stream_ai_response('Where can I get churros?')
+
+        self.assertEqual(next(chunks), 'Try ')
+        chunks.close()  # the browser went away mid-reply
+
+        stream.__exit__.assert_called_once()
+        self.assertEqual(app._inflight_requests, {})
+
+    def test_concurrent_identical_streams_share_one_call(self):
+        def slow_stream(**kwargs):
+            time.sleep(0.2)
+            return make_stream('Hola!')
+        self.openai_client.chat.completions.create.side_effect = slow_stream
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append("".join(app.stream_ai_response('Best tapas in Madrid?'))))
+                   for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ['Hola!'] * 3)
+        self.assertEqual(self.openai_client.chat.completions.create.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
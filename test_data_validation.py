@@ -0,0 +1,159 @@
+import time
+import unittest
+from unittest import mock
+
+from data_validation import ComprehensiveDataProcessor, DataValidator, ImageSourcer
+
+
+def make_head_response(url, status_code=200):
+    response = mock.Mock(status_code=status_code, url=url, headers={'content-type': 'text/html'})
+    response.elapsed.total_seconds.return_value = 0.01
+    return response
+
+
+class ValidateUrlsBulkTests(unittest.TestCase):
+    def setUp(self):
+        self.validator = DataValidator()
+        self.validator.session = mock.Mock()
+        self.validator.session.head.side_effect = lambda url, **kwargs: make_head_response(url)
+
+    def test_each_distinct_url_is_checked_once(self):
+        results = self.validator.validate_urls_bulk([
+            'https://www.yelp.com/search?find_desc=Cafe',
+            'https://www.yelp.com/search?find_desc=Cafe',
+            'https://www.tripadvisor.com/Search?q=Cafe',
+            '',
+        ])
+
+        self.assertEqual(set(results), {'https://www.yelp.com/search?find_desc=Cafe', 'https://www.tripadvisor.com/Search?q=Cafe'})
+        self.assertTrue(all(result['valid'] for result in results.values()))
+        self.assertEqual(self.validator.session.head.call_count, 2)
+
+    def test_answered_urls_are_cached(self):
+        self.validator.validate_url('https://www.yelp.com/search?find_desc=Cafe')
+        result = self.validator.validate_url('https://WWW.Yelp.com/search?find_desc=Cafe#reviews')
+
+        self.assertTrue(result['valid'])
+        self.assertEqual(self.validator.session.head.call_count, 1)
+
+    def test_fallback_images_are_not_probed(self):
+        sourcer = ImageSourcer(validator=self.validator)
+
+        result = self.validator.validate_url(sourcer.fallback_images['restaurant'])
+
+        self.assertTrue(result['valid'])
+        self.validator.session.head.assert_not_called()
+
+    def test_process_place_data_maps_results_back_to_keys(self):
+        processor = ComprehensiveDataProcessor()
+        processor.validator = self.validator
+        place = {
+            'name': 'Cafe Central',
+            'google_maps_url': 'https://www.google.com/maps/search/Cafe+Central',
+            'yelp_search_url': 'not-a-url',
+        }
+
+        enhanced = processor.process_place_data(place)
+
+        self.assertEqual(enhanced['google_maps_url_status'], 'valid')
+        self.assertEqual(enhanced['yelp_search_url_status'], 'invalid')
+
+    def test_repeat_place_is_processed_once(self):
+        processor = ComprehensiveDataProcessor()
+        processor.validator = self.validator
+        place = {'name': 'Cafe Central', 'google_maps_url': 'https://www.google.com/maps/search/Cafe+Central'}
+
+        with mock.patch.object(processor, '_enhance_place', wraps=processor._enhance_place) as enhance:
+            first = processor.process_place_data(place)
+            second = processor.process_place_data(dict(place, _data_quality_score=0.5))
+
+        self.assertEqual(enhance.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    def test_place_is_reprocessed_once_its_url_checks_expire(self):
+        processor = ComprehensiveDataProcessor()
+        processor.validator = self.validator
+        place = {'name': 'Cafe Central', 'google_maps_url': 'https://www.google.com/maps/search/Cafe+Central'}
+
+        with mock.patch.object(processor, '_enhance_place', wraps=processor._enhance_place) as enhance:
+            processor.process_place_data(place)
+            with mock.patch('data_validation.time.time', return_value=time.time() + DataValidator.URL_CACHE_TTL):
+                processor.process_place_data(place)
+
+        self.assertEqual(enhance.call_count, 2)
+
+    def test_process_places_bulk_preserves_order(self):
+        processor = ComprehensiveDataProcessor()
+        processor.validator = self.validator
+        places = [{'name': name, 'google_maps_url': f'https://www.google.com/maps/search/{name}'}
+                  for name in ('Cafe Central', 'Golden Dragon', 'Le Petit Bistro')]
+
+        enhanced = processor.process_places_bulk(places)
+
+        self.assertEqual([place['name'] for place in enhanced], ['Cafe Central', 'Golden Dragon', 'Le Petit Bistro'])
+        self.assertTrue(all(place['google_maps_url_status'] == 'valid' for place in enhanced))
+
+
+class GeocodeCacheTests(unittest.TestCase):
+    def test_repeat_addresses_are_geocoded_once(self):
+        gmaps_client = mock.Mock()
+        gmaps_client.geocode.return_value = [{
+            'geometry': {'location': {'lat': 35.0116, 'lng': 135.7681}, 'location_type': 'ROOFTOP'},
+            'formatted_address': 'Kyoto, Japan',
+        }]
+        validator = DataValidator(gmaps_client)
+
+        first = validator.validate_coordinates_match_address('Kyoto, Japan', 35.0116, 135.7681)
+        second = validator.validate_coordinates_match_address('  kyoto,  JAPAN ', 35.0116, 135.7681)
+
+        self.assertTrue(first['valid'])
+        self.assertEqual(first, second)
+        self.assertEqual(gmaps_client.geocode.call_count, 1)
+
+    def test_bulk_geocode_collapses_duplicate_addresses(self):
+        gmaps_client = mock.Mock()
+        gmaps_client.geocode.return_value = []
+        validator = DataValidator(gmaps_client)
+
+        results = validator.geocode_bulk(['Kyoto, Japan', 'kyoto,  japan', 'Osaka, Japan'])
+
+        self.assertEqual(gmaps_client.geocode.call_count, 2)
+        self.assertEqual(results, {'Kyoto, Japan': None, 'Osaka, Japan': None})
+
+
+class FallbackImageTests(unittest.TestCase):
+    def setUp(self):
+        self.sourcer = ImageSourcer(validator=DataValidator())
+
+    def test_highest_priority_type_wins(self):
+        result = self.sourcer._get_fallback_image(['point_of_interest', 'cafe', 'restaurant'])
+
+        self.assertEqual(result['url'], self.sourcer.fallback_images['restaurant'])
+        self.assertEqual(result['alt_text'], 'Restaurant image')
+
+    def test_compound_types_match_their_keyword(self):
+        self.assertEqual(self.sourcer._get_fallback_image(['clothing_store'])['alt_text'], 'Shopping image')
+        self.assertEqual(self.sourcer._get_fallback_image(['Hindu_Temple'])['alt_text'], 'Temple image')
+        self.assertEqual(self.sourcer._get_fallback_image(['point_of_interest'])['alt_text'], 'Default image')
+
+    def test_landmark_name_picks_its_specific_image(self):
+        result = self.sourcer._get_fallback_image(['tourist_attraction'], 'Fushimi Inari Taisha')
+
+        self.assertEqual(result['source'], 'pexels_specific')
+        self.assertEqual(result['url'], self.sourcer.specific_place_images['fushimi inari'])
+
+
+class DistanceTests(unittest.TestCase):
+    def test_bulk_distances_match_single_pair_distances(self):
+        validator = DataValidator()
+        pairs = [(35.0116, 135.7681, 34.6937, 135.5023), (40.7128, -74.0060, 51.5074, -0.1278)]
+
+        distances = validator.calculate_distances_bulk(*zip(*pairs))
+
+        for distance, pair in zip(distances, pairs):
+            self.assertAlmostEqual(distance, validator._calculate_distance(*pair), places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+import app
+
+
+def make_completion(content):
+    message = mock.Mock(content=content)
+    return mock.Mock(choices=[mock.Mock(message=message)])
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def setUp(self):
+        app._response_cache.clear()
+        app.record_upstream_success()
+        self.client = mock.Mock()
+        self.client.chat.completions.create.return_value = make_completion(' Bonjour! ')
+        patcher = mock.patch.object(app, 'openai_client', self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(app._response_cache.clear)
+        self.addCleanup(app.record_upstream_success)
+
+    def test_identical_prompt_is_served_from_cache(self):
+        first = app.get_ai_response('What is the capital of France?')
+        second = app.get_ai_response('What is the capital of France?')
+
+        self.assertEqual(first, 'Bonjour!')
+        self.assertEqual(second, 'Bonjour!')
+        self.assertEqual(self.client.chat.completions.create.call_count, 1)
+
+    def test_different_history_is_a_cache_miss(self):
+        app.get_ai_response('And the weather?')
+        app.get_ai_response('And the weather?', [{'role': 'user', 'content': 'I am going to Rome'}])
+
+        self.assertEqual(self.client.chat.completions.create.call_count, 2)
+
+    def test_failed_call_is_not_cached(self):
+        self.client.chat.completions.create.side_effect = [RuntimeError('upstream down'), make_completion('Ciao!')]
+
+        first = app.get_ai_response('Any tips for Lisbon?')
+        second = app.get_ai_response('Any tips for Lisbon?')
+
+        self.assertIn('technical difficulties', first)
+        self.assertEqual(second, 'Ciao!')
+
+    def test_concurrent_identical_prompts_share_one_call(self):
+        def slow_completion(**kwargs):
+            time.sleep(0.2)
+            return make_completion('Hola!')
+        self.client.chat.completions.create.side_effect = slow_completion
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(app.get_ai_response('Best tapas in Madrid?')))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ['Hola!'] * 4)
+        self.assertEqual(self.client.chat.completions.create.call_count, 1)
+        self.assertEqual(app._inflight_requests, {})
+
+    def test_leader_rechecks_cache_after_joining(self):
+        # Another leader stores its answer between this caller's cache miss and its join
+        with mock.patch.object(app, 'get_cached_response', side_effect=[None, 'Hola!']):
+            reply = app.get_ai_response('Best tapas in Madrid?')
+
+        self.assertEqual(reply, 'Hola!')
+        self.client.chat.completions.create.assert_not_called()
+        self.assertEqual(app._inflight_requests, {})
+
+    def test_greeting_skips_the_model(self):
+        reply = app.get_ai_response('Hey there!')
+
+        self.assertIn("I'm JetFriend", reply)
+        self.client.chat.completions.create.assert_not_called()
+
+    def test_semantic_hit_requires_the_same_places(self):
+        self.addCleanup(app._semantic_cache.clear)
+        paris = app.get_places_fingerprint([{'name': 'Le Petit Bistro'}])
+        app.store_semantic_cache([1.0, 0.0], 'Try Le Petit Bistro!', paris)
+
+        self.assertEqual(app.lookup_semantic_cache([1.0, 0.0], paris), 'Try Le Petit Bistro!')
+        self.assertIsNone(app.lookup_semantic_cache([1.0, 0.0], app.get_places_fingerprint([{'name': 'Golden Dragon'}])))
+        self.assertIsNone(app.lookup_semantic_cache([1.0, 0.0]))
+
+    def test_semantic_hit_requires_the_same_place_details(self):
+        self.addCleanup(app._semantic_cache.clear)
+        place = {'name': 'Le Petit Bistro', 'address': '1 Rue de Rivoli', 'rating': 4.5}
+        app.store_semantic_cache([1.0, 0.0], 'Try Le Petit Bistro!', app.get_places_fingerprint([place]))
+
+        updated = app.get_places_fingerprint([dict(place, rating=4.7)])
+        self.assertIsNone(app.lookup_semantic_cache([1.0, 0.0], updated))
+
+    def test_breaker_opens_after_repeated_failures(self):
+        self.client.chat.completions.create.side_effect = RuntimeError('upstream down')
+
+        for attempt in range(app.CIRCUIT_BREAKER_FAIL_MAX):
+            app.get_ai_response(f'Question {attempt}')
+        reply = app.get_ai_response('One more question')
+
+        self.assertIn('try again in about 30 seconds', reply)
+        self.assertEqual(self.client.chat.completions.create.call_count, app.CIRCUIT_BREAKER_FAIL_MAX)
+
+    def test_half_open_breaker_lets_one_trial_call_through(self):
+        self.client.chat.completions.create.side_effect = RuntimeError('upstream down')
+        for attempt in range(app.CIRCUIT_BREAKER_FAIL_MAX):
+            app.get_ai_response(f'Question {attempt}')
+        app._breaker_opened_at -= app.CIRCUIT_BREAKER_RESET_TIMEOUT
+
+        concurrent_replies = []
+        def trial_call(**kwargs):
+            # A second request arrives while the trial call is still waiting on the upstream
+            if self.client.chat.completions.create.call_count == app.CIRCUIT_BREAKER_FAIL_MAX + 1:
+                concurrent_replies.append(app.get_ai_response('Second question after the timeout'))
+            return make_completion('Back online!')
+        self.client.chat.completions.create.side_effect = trial_call
+
+        reply = app.get_ai_response('First question after the timeout')
+
+        self.assertEqual(reply, 'Back online!')
+        self.assertIn('try again in about 30 seconds', concurrent_replies[0])
+        self.assertEqual(self.client.chat.completions.create.call_count, app.CIRCUIT_BREAKER_FAIL_MAX + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()